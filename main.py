@@ -1,17 +1,35 @@
-"""CLI for resume generator."""
+"""CLI for resume generator.
+
+Jinja, pydantic and Playwright are imported inside the commands that need
+them, so requests served by the render daemon skip their import cost.
+"""
+from __future__ import annotations
+
+import asyncio
 import re
 import unicodedata
-from dataclasses import dataclass
-from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, replace
+from datetime import date, datetime
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Any, Iterator, Optional
 
 from cyclopts import App, Parameter
 
 from resume_generator.archive import resolve_archive_dir, resolve_input_dir, resolve_output_dir
-from resume_generator.generator import ResumeGenerator
-from resume_generator.loader import load_resume_model
-from resume_generator.pdf import render_pdf_from_html_file
+from resume_generator.daemon import RenderDaemon, request_daemon
+from resume_generator.fonts import fetch_fonts, resolve_font_dir
+from resume_generator.pdf import (
+    DEFAULT_READY_TIMEOUT_MS,
+    render_pdf_from_html,
+    render_pdf_from_html_file,
+    render_pdfs_from_html,
+)
+from resume_generator.pipeline import DEFAULT_QUEUE_SIZE, Pipeline, StageStats
+
+if TYPE_CHECKING:
+    from resume_generator.generator import ResumeGenerator
+    from resume_generator.models import Resume
 
 app = App(
     name="resume-generator",
@@ -104,6 +122,22 @@ class GenerateOptions:
     profile_photo: Optional[Path] = None
     force: bool = False
     file_date: bool = False
+    embed_fonts: bool = False
+    bytecode_cache: bool = False
+    compiled_templates: Optional[Path] = None
+    icon_sprite: bool = False
+    photo_dpi: Optional[int] = None
+    minify_css: bool = False
+    prune_css: bool = False
+    today: Optional[date] = None
+    daemon: bool = True
+
+
+@Parameter(name="*")
+@dataclass
+class FetchFontsOptions:
+    font_dir: Optional[Path] = None
+    force: bool = False
 
 
 @Parameter(name="*")
@@ -113,6 +147,9 @@ class PdfOptions:
     output_file: Optional[Path] = None
     force: bool = False
     file_date: bool = False
+    cache: bool = True
+    daemon: bool = True
+    ready_timeout_ms: float = DEFAULT_READY_TIMEOUT_MS
 
 
 @Parameter(name="*")
@@ -125,6 +162,33 @@ class FullOptions:
     pdf_file: Optional[Path] = None
     force: bool = False
     file_date: bool = False
+    embed_fonts: bool = False
+    bytecode_cache: bool = False
+    compiled_templates: Optional[Path] = None
+    icon_sprite: bool = False
+    photo_dpi: Optional[int] = None
+    minify_css: bool = False
+    prune_css: bool = False
+    today: Optional[date] = None
+    write_html: bool = True
+    cache: bool = True
+    daemon: bool = True
+    ready_timeout_ms: float = DEFAULT_READY_TIMEOUT_MS
+
+
+@Parameter(name="*")
+@dataclass
+class CompileTemplatesOptions:
+    template_dir: Optional[Path] = None
+    output_file: Path = Path("templates.zip")
+    force: bool = False
+
+
+@Parameter(name="*")
+@dataclass
+class ServeOptions:
+    socket: Optional[Path] = None
+    concurrency: int = 1
 
 
 @Parameter(name="*")
@@ -137,26 +201,117 @@ class FullManyOptions:
     profile_photo: Optional[Path] = None
     force: bool = False
     file_date: bool = False
+    embed_fonts: bool = False
+    bytecode_cache: bool = False
+    compiled_templates: Optional[Path] = None
+    icon_sprite: bool = False
+    photo_dpi: Optional[int] = None
+    minify_css: bool = False
+    prune_css: bool = False
+    today: Optional[date] = None
+    concurrency: int = 1
+    workers: int = 1
+    write_html: bool = True
+    cache: bool = True
+    model_cache: bool = False
+    trusted: bool = False
+    incremental: bool = False
+    queue_size: int = DEFAULT_QUEUE_SIZE
+    pipeline_stats: bool = False
+    ready_timeout_ms: float = DEFAULT_READY_TIMEOUT_MS
 
 
-def _generate_html(
+@Parameter(name="*")
+@dataclass
+class VariantsOptions:
+    input_file: Path
+    config: Path
+    output_dir: Path = Path("variants")
+    force: bool = False
+    today: Optional[date] = None
+    concurrency: int = 1
+    write_html: bool = True
+    cache: bool = True
+    ready_timeout_ms: float = DEFAULT_READY_TIMEOUT_MS
+
+
+def _generator_settings(
+    options: GenerateOptions | FullOptions | FullManyOptions,
+) -> dict[str, Any]:
+    """Collect the ``ResumeGenerator`` keyword arguments shared by the commands."""
+    return {
+        "template_dir": options.template_dir,
+        "profile_photo": options.profile_photo,
+        "embed_fonts": options.embed_fonts,
+        "bytecode_cache": options.bytecode_cache,
+        "compiled_templates": options.compiled_templates,
+        "icon_sprite": options.icon_sprite,
+        "photo_dpi": options.photo_dpi,
+        "minify_css": options.minify_css,
+        "prune_css": options.prune_css,
+        "today": options.today,
+    }
+
+
+def _load_resume_and_generator(
     input_file: Path,
-    output_file: Path,
-    template_dir: Optional[Path],
-    profile_photo: Optional[Path],
-    *,
-    force: bool = False,
-    timestamp: Optional[str] = None,
-) -> Path:
+    settings: dict[str, Any],
+) -> tuple[Resume, ResumeGenerator]:
+    from resume_generator.generator import ResumeGenerator
+    from resume_generator.loader import load_resume_model
+
     input_path = _ensure_exists(input_file, "Resume file")
 
     resume = load_resume_model(input_path)
 
-    generator = ResumeGenerator(
-        template_dir=template_dir,
-        profile_photo=profile_photo,
+    generator = ResumeGenerator(**settings)
+    return resume, generator
+
+
+def _absolute(path: Optional[Path]) -> Optional[str]:
+    return str(Path(path).resolve()) if path else None
+
+
+def _daemon_value(value: Any) -> Any:
+    if isinstance(value, Path):
+        return _absolute(value)
+    if isinstance(value, date):
+        return value.isoformat()
+    return value
+
+
+def _daemon_settings(settings: dict[str, Any]) -> dict[str, Any]:
+    # The daemon has its own working directory; relative photos resolve against ours.
+    daemon_settings = {key: _daemon_value(value) for key, value in settings.items()}
+    daemon_settings["working_dir"] = _absolute(Path.cwd())
+    return daemon_settings
+
+
+def _run_in_daemon(payload: dict[str, Any], enabled: bool) -> bool:
+    """Hand the request to a running render daemon; ``False`` means render locally."""
+    if not enabled:
+        return False
+    return request_daemon(payload) is not None
+
+
+def _generate_html(options: GenerateOptions, *, timestamp: Optional[str] = None) -> Path:
+    input_path = _ensure_exists(options.input_file, "Resume file")
+    output_path = _prepare_output_path(
+        options.output_file,
+        timestamp=timestamp,
+        force=options.force,
     )
-    output_path = _prepare_output_path(output_file, timestamp=timestamp, force=force)
+    settings = _generator_settings(options)
+    payload = {
+        "command": "generate",
+        "input_file": _absolute(input_path),
+        "output_file": _absolute(output_path),
+        "generator": _daemon_settings(settings),
+    }
+    if _run_in_daemon(payload, options.daemon):
+        return output_path
+
+    resume, generator = _load_resume_and_generator(input_path, settings)
     generator.generate_html_file(resume, output_path)
     return output_path
 
@@ -166,14 +321,7 @@ def generate(options: GenerateOptions) -> None:
     """Generate an HTML resume."""
 
     timestamp = _timestamp_suffix() if options.file_date else None
-    output_path = _generate_html(
-        options.input_file,
-        options.output_file,
-        options.template_dir,
-        options.profile_photo,
-        force=options.force,
-        timestamp=timestamp,
-    )
+    output_path = _generate_html(options, timestamp=timestamp)
     print(f"Resume generated successfully: {output_path}")
 
 
@@ -190,7 +338,20 @@ def pdf(options: PdfOptions) -> None:
         force=options.force,
     )
 
-    render_pdf_from_html_file(html_path, target_pdf)
+    payload = {
+        "command": "pdf",
+        "html_file": _absolute(html_path),
+        "output_file": _absolute(target_pdf),
+        "cache": options.cache,
+        "ready_timeout_ms": options.ready_timeout_ms,
+    }
+    if not _run_in_daemon(payload, options.daemon):
+        render_pdf_from_html_file(
+            html_path,
+            target_pdf,
+            ready_timeout_ms=options.ready_timeout_ms,
+            use_cache=options.cache,
+        )
     print(f"PDF created successfully: {target_pdf}")
 
 
@@ -199,14 +360,15 @@ def full(options: FullOptions) -> None:
     """Generate both HTML and PDF outputs with matching names by default."""
 
     timestamp = _timestamp_suffix() if options.file_date else None
-    html_path = _generate_html(
-        options.input_file,
-        options.output_file,
-        options.template_dir,
-        options.profile_photo,
-        force=options.force,
-        timestamp=timestamp,
-    )
+    input_path = _ensure_exists(options.input_file, "Resume file")
+    if options.write_html:
+        html_path = _prepare_output_path(
+            options.output_file,
+            timestamp=timestamp,
+            force=options.force,
+        )
+    else:
+        html_path = _with_timestamp(Path(options.output_file), timestamp)
     pdf_candidate = options.pdf_file or html_path.with_suffix(".pdf")
     pdf_timestamp = timestamp if options.pdf_file else None
     target_pdf = _prepare_output_path(
@@ -215,26 +377,35 @@ def full(options: FullOptions) -> None:
         force=options.force,
     )
 
-    render_pdf_from_html_file(html_path, target_pdf)
-    print(f"Resume generated: {html_path}")
+    settings = _generator_settings(options)
+    payload = {
+        "command": "full",
+        "input_file": _absolute(input_path),
+        "output_file": _absolute(html_path) if options.write_html else None,
+        "pdf_file": _absolute(target_pdf),
+        "generator": _daemon_settings(settings),
+        "cache": options.cache,
+        "ready_timeout_ms": options.ready_timeout_ms,
+    }
+    if not _run_in_daemon(payload, options.daemon):
+        resume, generator = _load_resume_and_generator(input_path, settings)
+        html_content = generator.generate_html(resume)
+        if options.write_html:
+            html_path.write_text(html_content, encoding="utf-8")
+        render_pdf_from_html(
+            html_content,
+            target_pdf,
+            ready_timeout_ms=options.ready_timeout_ms,
+            use_cache=options.cache,
+        )
+    if options.write_html:
+        print(f"Resume generated: {html_path}")
     print(f"PDF generated: {target_pdf}")
 
 
-@app.command(name="full-many")
-def full_many(options: FullManyOptions = FullManyOptions()) -> None:
-    """Process every JSON/YAML resume in a directory to HTML and PDF outputs."""
-
-    archive_dir = resolve_archive_dir(options.archive_dir)
-    input_dir = Path(options.input_dir) if options.input_dir else resolve_input_dir(archive_dir)
-    input_dir = _ensure_exists(input_dir, "Input directory")
-    if not input_dir.is_dir():
-        raise NotADirectoryError(f"Input directory is not a directory: {input_dir}")
-
-    output_dir = Path(options.output_dir) if options.output_dir else resolve_output_dir(archive_dir)
-    output_dir.mkdir(parents=True, exist_ok=True)
-
+def _discover_resume_files(input_dir: Path) -> list[Path]:
     candidates = []
-    for pattern in ("*.json", "*.yaml", "*.yml"):
+    for pattern in ("*.json", "*.yaml", "*.yml", "*.jsonl", "*.ndjson"):
         candidates.extend(sorted(input_dir.glob(pattern)))
 
     resume_files: list[Path] = []
@@ -245,46 +416,218 @@ def full_many(options: FullManyOptions = FullManyOptions()) -> None:
             continue
         seen.add(resolved_candidate)
         resume_files.append(candidate)
+    return resume_files
+
+
+@dataclass
+class _BatchResult:
+    """Outputs grouped per input file, plus the manifest entries recorded for them."""
+
+    grouped: list[list[tuple[Optional[Path], Path]]]
+    manifest_entries: dict[str, dict[str, Any]] = field(default_factory=dict)
+    unchanged: int = 0
+    stages: list[StageStats] = field(default_factory=list)
+
+
+def _process_resume_files(
+    resume_files: list[Path],
+    output_dir: Path,
+    options: FullManyOptions,
+) -> _BatchResult:
+    """Render every resume record in ``resume_files`` with one generator and one browser.
+
+    Records are read lazily, so rendering starts while large JSON Lines or
+    multi-document YAML files are still being parsed. With ``--incremental``,
+    files whose manifest entry is still current reuse their previous outputs.
+    """
+    from resume_generator.generator import ResumeGenerator
+    from resume_generator.loader import ModelCache, iter_resume_records
+    from resume_generator.manifest import (
+        BuildManifest,
+        environment_fingerprint,
+        file_hash,
+        open_ended_starts,
+    )
+
+    settings = _generator_settings(options)
+    generator = ResumeGenerator(**settings)
+    model_cache = ModelCache() if options.model_cache else None
+    manifest = BuildManifest(output_dir) if options.incremental else None
+    # Output options count too: reusing an HTML-less run must not drop the HTML.
+    output_settings = {**settings, "write_html": options.write_html}
+    environment = environment_fingerprint(generator, output_settings) if manifest else ""
+    today = options.today or date.today()
+
+    result = _BatchResult(grouped=[])
+
+    def load() -> Iterator[tuple[Resume, Optional[Path], Path]]:
+        for resume_path in resume_files:
+            file_outputs: list[tuple[Optional[Path], Path]] = []
+            result.grouped.append(file_outputs)
+            input_hash = file_hash(resume_path) if manifest else ""
+            if manifest:
+                previous = manifest.lookup(resume_path, input_hash, environment, today)
+                if previous is not None:
+                    file_outputs.extend(previous)
+                    result.unchanged += 1
+                    continue
+
+            open_starts: list[date] = []
+            pictures: list[Path] = []
+            records = iter_resume_records(resume_path, model_cache, trusted=options.trusted)
+            for index, resume in enumerate(records):
+                # Later records of a stream nest under the file's own folder, so
+                # they cannot collide with the outputs of a sibling input file.
+                record_dir = output_dir / resume_path.stem
+                if index:
+                    record_dir /= str(index + 1)
+                target_dir = record_dir / _dated_folder_name()
+                target_dir.mkdir(parents=True, exist_ok=True)
+                base_name = _cv_basename(
+                    resume.basics.name if resume.basics else None,
+                    fallback=resume_path.stem,
+                )
+                html_candidate = target_dir / f"{base_name}.html"
+                html_path = (
+                    _prepare_output_path(html_candidate, timestamp=None, force=options.force)
+                    if options.write_html
+                    else None
+                )
+                pdf_path = _prepare_output_path(
+                    html_candidate.with_suffix(".pdf"),
+                    timestamp=None,
+                    force=options.force,
+                )
+                file_outputs.append((html_path, pdf_path))
+                open_starts.extend(open_ended_starts([resume]))
+                if manifest and (picture := generator.picture_file(resume)):
+                    pictures.append(picture)
+                yield resume, html_path, pdf_path
+
+            if manifest:
+                # Only saved once the whole batch succeeded, so recording early is safe.
+                manifest.record(
+                    resume_path,
+                    input_hash,
+                    environment,
+                    today,
+                    open_starts,
+                    file_outputs,
+                    pictures,
+                )
+                key = str(resume_path.resolve())
+                result.manifest_entries[key] = manifest.entries[key]
+
+    def render(job: tuple[Resume, Optional[Path], Path]) -> Iterator[tuple[str, Path]]:
+        resume, html_path, pdf_path = job
+        html_content = generator.generate_html(resume)
+        if html_path is not None:
+            html_path.write_text(html_content, encoding="utf-8")
+        yield html_content, pdf_path
+
+    # Parsing and templating run on their own threads while Chromium prints.
+    pipeline = Pipeline(load(), name="load", maxsize=options.queue_size).stage("html", render)
+    render_pdfs_from_html(
+        pipeline,
+        concurrency=options.concurrency,
+        ready_timeout_ms=options.ready_timeout_ms,
+        use_cache=options.cache,
+    )
+    result.stages = pipeline.stats
+    return result
+
+
+def _process_in_workers(
+    resume_files: list[Path],
+    output_dir: Path,
+    options: FullManyOptions,
+) -> _BatchResult:
+    """Shard files round-robin across worker processes and merge in input order."""
+    workers = min(options.workers, len(resume_files))
+    shards = [resume_files[index::workers] for index in range(workers)]
+    merged = _BatchResult(grouped=[[] for _ in resume_files])
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(_process_resume_files, shard, output_dir, options)
+            for shard in shards
+        ]
+        for shard_index, future in enumerate(futures):
+            shard_result = future.result()
+            for offset, file_outputs in enumerate(shard_result.grouped):
+                merged.grouped[shard_index + offset * workers] = file_outputs
+            merged.manifest_entries.update(shard_result.manifest_entries)
+            merged.unchanged += shard_result.unchanged
+            if not merged.stages:
+                merged.stages = shard_result.stages
+            else:
+                for stats, shard_stats in zip(merged.stages, shard_result.stages):
+                    stats.merge(shard_stats)
+    return merged
+
+
+@app.command(name="full-many")
+def full_many(options: FullManyOptions = FullManyOptions()) -> None:
+    """Process every JSON, YAML or JSON Lines resume in a directory to HTML and PDF."""
+
+    archive_dir = resolve_archive_dir(options.archive_dir)
+    input_dir = Path(options.input_dir) if options.input_dir else resolve_input_dir(archive_dir)
+    input_dir = _ensure_exists(input_dir, "Input directory")
+    if not input_dir.is_dir():
+        raise NotADirectoryError(f"Input directory is not a directory: {input_dir}")
+    if options.concurrency < 1:
+        raise ValueError(f"--concurrency must be at least 1, got {options.concurrency}")
+    if options.workers < 1:
+        raise ValueError(f"--workers must be at least 1, got {options.workers}")
+    if options.queue_size < 1:
+        raise ValueError(f"--queue-size must be at least 1, got {options.queue_size}")
+
+    output_dir = Path(options.output_dir) if options.output_dir else resolve_output_dir(archive_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
 
+    resume_files = _discover_resume_files(input_dir)
     if not resume_files:
         raise FileNotFoundError(
             f"No JSON or YAML resumes found in directory: {input_dir}"
         )
+    # Pin the reference date so every resume (and worker) in the batch agrees.
+    if options.today is None:
+        options = replace(options, today=date.today())
+
+    if options.workers > 1 and len(resume_files) > 1:
+        result = _process_in_workers(resume_files, output_dir, options)
+    else:
+        result = _process_resume_files(resume_files, output_dir, options)
+    processed = [outputs for file_outputs in result.grouped for outputs in file_outputs]
+    if options.incremental:
+        from resume_generator.manifest import BuildManifest
+
+        manifest = BuildManifest(output_dir)
+        manifest.entries.update(result.manifest_entries)
+        manifest.save()
 
-    generator = ResumeGenerator(
-        template_dir=options.template_dir,
-        profile_photo=options.profile_photo,
-    )
+    print(f"Processed {len(processed)} resume(s) into {output_dir}:")
+    if result.unchanged:
+        print(f"  ({result.unchanged} unchanged file(s) reused their previous outputs)")
+    _print_outputs(output_dir, processed)
+    if options.pipeline_stats:
+        _print_stage_stats(result.stages, len(processed))
 
-    processed: list[tuple[Path, Path]] = []
-    for resume_path in resume_files:
-        resume = load_resume_model(resume_path)
-        dated_folder = _dated_folder_name()
-        target_dir = output_dir / resume_path.stem / dated_folder
-        target_dir.mkdir(parents=True, exist_ok=True)
-        base_name = _cv_basename(
-            resume.basics.name if resume.basics else None,
-            fallback=resume_path.stem,
-        )
-        html_candidate = target_dir / f"{base_name}.html"
-        html_path = _prepare_output_path(
-            html_candidate,
-            timestamp=None,
-            force=options.force,
-        )
-        generator.generate_html_file(resume, html_path)
 
-        pdf_candidate = html_path.with_suffix(".pdf")
-        pdf_path = _prepare_output_path(
-            pdf_candidate,
-            timestamp=None,
-            force=options.force,
+def _print_stage_stats(stages: list[StageStats], printed: int) -> None:
+    print("Pipeline stages (busy time excludes waiting; depth is the stage's output queue):")
+    for stats in stages:
+        print(
+            f"  {stats.name}: {stats.processed} item(s), busy {stats.busy_seconds:.2f}s, "
+            f"peak queue depth {stats.peak_depth}/{stats.capacity}"
         )
-        render_pdf_from_html_file(html_path, pdf_path)
-        processed.append((html_path, pdf_path))
+    print(f"  pdf: {printed} item(s)")
 
-    print(f"Processed {len(processed)} resume(s) into {output_dir}:")
+
+def _print_outputs(output_dir: Path, processed: list[tuple[Optional[Path], Path]]) -> None:
     for html_path, pdf_path in processed:
+        if html_path is None:
+            print(f"  - {_relative_or_full(output_dir, pdf_path)}")
+            continue
         print(
             "  - "
             f"{_relative_or_full(output_dir, html_path)}"
@@ -293,6 +636,97 @@ def full_many(options: FullManyOptions = FullManyOptions()) -> None:
         )
 
 
+@app.command()
+def variants(options: VariantsOptions) -> None:
+    """Render one resume in every variant of a config file, side by side."""
+
+    from resume_generator.loader import load_resume_model
+    from resume_generator.variants import VariantRenderer, load_variants
+
+    input_path = _ensure_exists(options.input_file, "Resume file")
+    variant_list = load_variants(_ensure_exists(options.config, "Variant config"))
+    output_dir = Path(options.output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    resume = load_resume_model(input_path)
+    renderer = VariantRenderer({"today": options.today or date.today()})
+    base_name = _cv_basename(resume.basics.name, fallback=input_path.stem)
+    processed: list[tuple[Optional[Path], Path]] = []
+
+    def jobs() -> Iterator[tuple[str, Path]]:
+        for variant in variant_list:
+            suffix = _clean_component(variant.name, "variant")
+            html_candidate = output_dir / f"{base_name}_{suffix}.html"
+            html_path = (
+                _prepare_output_path(html_candidate, timestamp=None, force=options.force)
+                if options.write_html
+                else None
+            )
+            pdf_path = _prepare_output_path(
+                html_candidate.with_suffix(".pdf"),
+                timestamp=None,
+                force=options.force,
+            )
+            html_content = renderer.generate_html(resume, variant)
+            if html_path is not None:
+                html_path.write_text(html_content, encoding="utf-8")
+            processed.append((html_path, pdf_path))
+            yield html_content, pdf_path
+
+    render_pdfs_from_html(
+        jobs(),
+        concurrency=options.concurrency,
+        ready_timeout_ms=options.ready_timeout_ms,
+        use_cache=options.cache,
+    )
+    print(f"Rendered {len(processed)} variant(s) into {output_dir}:")
+    _print_outputs(output_dir, processed)
+
+
+@app.command()
+def serve(options: ServeOptions = ServeOptions()) -> None:
+    """Keep a warm generator and browser resident for fast CLI renders."""
+
+    daemon = RenderDaemon(options.socket, concurrency=options.concurrency)
+    print(f"Render daemon listening on {daemon.socket_path} (Ctrl+C to stop)")
+    try:
+        asyncio.run(daemon.serve_forever())
+    except KeyboardInterrupt:
+        print("Render daemon stopped")
+
+
+@app.command(name="compile-templates")
+def compile_templates_command(
+    options: CompileTemplatesOptions = CompileTemplatesOptions(),
+) -> None:
+    """Precompile a template directory into an archive for --compiled-templates."""
+
+    from resume_generator.generator import compile_templates
+
+    target = _prepare_output_path(options.output_file, timestamp=None, force=options.force)
+    target.unlink(missing_ok=True)
+    compile_templates(options.template_dir, target)
+    print(f"Templates compiled: {target}")
+
+
+@app.command(name="fetch-fonts")
+def fetch_fonts_command(options: FetchFontsOptions = FetchFontsOptions()) -> None:
+    """Download the template fonts so ``--embed-fonts`` works offline."""
+
+    written = fetch_fonts(options.font_dir, force=options.force)
+    font_dir = resolve_font_dir(options.font_dir)
+    print(f"Fetched {len(written)} font file(s) into {font_dir}")
+
+
+@app.command()
+def info() -> None:
+    """Show which parser backends are in use."""
+    from resume_generator.loader import parser_backends
+
+    for file_format, backend in parser_backends().items():
+        print(f"{file_format} parser: {backend}")
+
+
 @app.default
 def default(options: GenerateOptions) -> None:  # type: ignore[override]
     """Run the ``generate`` command when none specified."""
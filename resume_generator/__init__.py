@@ -1,14 +1,68 @@
-"""Resume Generator - Convert JSON or YAML resume to HTML (and PDF)."""
-from .generator import ResumeGenerator
-from .loader import load_resume_data, load_resume_model
-from .models import Resume
-from .pdf import html_to_pdf, render_pdf_from_html_file
+"""Resume Generator - Convert JSON or YAML resume to HTML (and PDF).
+
+Names are imported from their submodules on first access, so importing one
+submodule (as the CLI does for the render daemon client) does not load Jinja,
+pydantic and Playwright.
+"""
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+	from .generator import ResumeGenerator, compile_templates
+	from .loader import construct_resume, load_resume_data, load_resume_model, validate_resumes
+	from .models import Resume
+	from .pdf import (
+		PdfCache,
+		PdfRenderer,
+		RenderTimeoutError,
+		html_to_pdf,
+		render_pdf_from_html,
+		render_pdf_from_html_file,
+		render_pdfs_from_html,
+		render_pdfs_from_html_files,
+	)
+
+_EXPORTS = {
+	"Resume": ".models",
+	"ResumeGenerator": ".generator",
+	"compile_templates": ".generator",
+	"construct_resume": ".loader",
+	"load_resume_data": ".loader",
+	"load_resume_model": ".loader",
+	"validate_resumes": ".loader",
+	"PdfCache": ".pdf",
+	"PdfRenderer": ".pdf",
+	"RenderTimeoutError": ".pdf",
+	"html_to_pdf": ".pdf",
+	"render_pdf_from_html": ".pdf",
+	"render_pdf_from_html_file": ".pdf",
+	"render_pdfs_from_html": ".pdf",
+	"render_pdfs_from_html_files": ".pdf",
+}
 
 __all__ = [
 	"Resume",
 	"ResumeGenerator",
+	"compile_templates",
+	"construct_resume",
 	"load_resume_data",
 	"load_resume_model",
+	"validate_resumes",
+	"PdfCache",
+	"PdfRenderer",
+	"RenderTimeoutError",
 	"html_to_pdf",
+	"render_pdf_from_html",
 	"render_pdf_from_html_file",
+	"render_pdfs_from_html",
+	"render_pdfs_from_html_files",
 ]
+
+
+def __getattr__(name: str) -> Any:
+	module = _EXPORTS.get(name)
+	if module is None:
+		raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+	value = getattr(import_module(module, __name__), name)
+	globals()[name] = value
+	return value
@@ -1,7 +1,20 @@
 """Utilities for embedding assets."""
 import base64
+import hashlib
+import io
+import math
+import os
+import re
+import threading
+from collections import OrderedDict
+from collections.abc import Iterator, Mapping
+from functools import partial
 from pathlib import Path
-from typing import Optional, Union
+from typing import Any, Callable, Optional, Sequence, TypeVar, Union
+
+from .cache import CacheStats, resolve_cache_dir
+
+T = TypeVar("T")
 
 
 def get_image_as_data_uri(image_path: Union[str, Path]) -> Optional[str]:
@@ -40,6 +53,156 @@ def get_image_as_data_uri(image_path: Union[str, Path]) -> Optional[str]:
     return None
 
 
+# CSS pixels of ``.profile-pic img`` (``--profile-pic-size`` in styles.css).
+PROFILE_PHOTO_SIZE_PX = 85
+DEFAULT_PHOTO_DPI = 192
+DEFAULT_PHOTO_QUALITY = 80
+_CSS_PX_PER_INCH = 96
+# Vector and animated formats are embedded untouched.
+_PASSTHROUGH_SUFFIXES = frozenset({".svg", ".gif"})
+
+
+def _encode_photo(data: bytes, pixels: int, quality: int) -> Optional[bytes]:
+    """Return ``data`` as a cropped WebP, or ``None`` if Pillow cannot decode it."""
+    try:
+        from PIL import Image, ImageOps
+    except ImportError as exc:
+        raise ImportError(
+            "Optimizing photos requires Pillow: install 'pillow' (or the 'images' extra)."
+        ) from exc
+
+    try:
+        with Image.open(io.BytesIO(data)) as source:
+            image = ImageOps.exif_transpose(source)
+            if image.mode not in ("RGB", "RGBA"):
+                # Palette images keep their transparency through RGBA.
+                alpha = "A" in image.getbands() or "transparency" in image.info
+                image = image.convert("RGBA" if alpha else "RGB")
+            # ``object-fit: cover`` in a square box: crop to the centre, never upscale.
+            side = min(pixels, image.width, image.height)
+            image = ImageOps.fit(image, (side, side), Image.Resampling.LANCZOS)
+            buffer = io.BytesIO()
+            # Saving without ``exif``/``icc_profile`` drops the source metadata.
+            image.save(buffer, format="WEBP", quality=quality, method=6)
+    except (OSError, ValueError, Image.DecompressionBombError):
+        # Corrupt, truncated, oversized or unsupported (``UnidentifiedImageError``).
+        return None
+    return buffer.getvalue()
+
+
+def optimize_photo(
+    image_path: Union[str, Path],
+    size_px: int = PROFILE_PHOTO_SIZE_PX,
+    dpi: int = DEFAULT_PHOTO_DPI,
+    quality: int = DEFAULT_PHOTO_QUALITY,
+    cache_dir: Optional[Path] = None,
+) -> Optional[str]:
+    """Return a data URI of ``image_path`` resized for its rendered box.
+
+    The photo is cropped to a square of ``size_px`` CSS pixels at ``dpi``,
+    re-encoded as WebP without metadata and stored under the ``images`` cache
+    directory keyed by the source content and these parameters. SVG and GIF
+    files, and photos Pillow cannot decode, are embedded as-is; ``None`` is
+    returned if the file cannot be read.
+    """
+    path = Path(image_path)
+    if path.suffix.lower() in _PASSTHROUGH_SUFFIXES:
+        return get_image_as_data_uri(path)
+    try:
+        data = path.read_bytes()
+    except (OSError, ValueError):
+        return None
+
+    pixels = math.ceil(size_px * dpi / _CSS_PX_PER_INCH)
+    digest = hashlib.sha256(f"{pixels}|{quality}|webp\n".encode())
+    digest.update(data)
+    directory = Path(cache_dir) if cache_dir else resolve_cache_dir("images")
+    entry = directory / f"{digest.hexdigest()}.webp"
+    try:
+        encoded = entry.read_bytes()
+    except FileNotFoundError:
+        encoded = _encode_photo(data, pixels, quality)
+        if encoded is None:
+            # Embed the photo untouched, as without a ``dpi``.
+            return get_image_as_data_uri(path)
+        directory.mkdir(parents=True, exist_ok=True)
+        staging = entry.with_name(f"{entry.name}.{os.getpid()}.tmp")
+        staging.write_bytes(encoded)
+        os.replace(staging, entry)
+    return f"data:image/webp;base64,{base64.b64encode(encoded).decode('ascii')}"
+
+
+def _file_signature(path: Path) -> Optional[tuple[int, int]]:
+    try:
+        stat = path.stat()
+    except (OSError, ValueError):
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+DEFAULT_ASSET_CACHE_SIZE = 64
+
+
+class AssetCache:
+    """Memoize values derived from files until one of the files changes.
+
+    Each entry remembers the mtime and size of the files it was built from and
+    is rebuilt as soon as any of them differs (or appears/disappears), so a
+    long-running generator picks up edited stylesheets and photos while
+    repeated renders only pay for a ``stat`` call. At most ``maxsize`` entries
+    are kept, evicting the least recently used, so batches with many distinct
+    photos do not accumulate their data URIs.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_ASSET_CACHE_SIZE) -> None:
+        self.maxsize = maxsize
+        self.stats = CacheStats()
+        self._entries: OrderedDict[Any, tuple[tuple[Any, ...], Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Any, paths: Sequence[Path], build: Callable[[], T]) -> T:
+        """Return the cached value for ``key`` or ``build()`` it on a miss."""
+        signature = tuple(_file_signature(Path(path)) for path in paths)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == signature:
+                self._entries.move_to_end(key)
+                self.stats.hits += 1
+                return entry[1]
+            self.stats.misses += 1
+        value = build()
+        with self._lock:
+            self._entries[key] = (signature, value)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return value
+
+    def read_text(self, path: Path) -> str:
+        """Return the text of ``path``, re-reading it only after it changes."""
+        return self.get(("text", path), (path,), lambda: path.read_text(encoding="utf-8"))
+
+    def image_data_uri(
+        self,
+        image_path: Union[str, Path],
+        dpi: Optional[int] = None,
+    ) -> Optional[str]:
+        """Cached variant of ``get_image_as_data_uri``.
+
+        With ``dpi`` the image goes through ``optimize_photo`` instead of being
+        embedded byte for byte.
+        """
+        path = Path(image_path)
+        if dpi is None:
+            build = partial(get_image_as_data_uri, path)
+        else:
+            build = partial(optimize_photo, path, dpi=dpi)
+        return self.get(("image", str(image_path), dpi), (path,), build)
+
+
 def get_placeholder_avatar_svg() -> str:
     """Return a placeholder avatar SVG for when image is unavailable."""
     return '''<svg xmlns="http://www.w3.org/2000/svg" width="85" height="85" viewBox="0 0 85 85" fill="none">
@@ -98,3 +261,69 @@ def get_icon_svg(icon_name: str) -> str:
     """
     icons = get_svg_icons()
     return icons.get(icon_name, '')
+
+
+_SVG_RE = re.compile(r"<svg(?P<attrs>[^>]*)>(?P<body>.*)</svg>", re.DOTALL)
+_VIEWBOX_RE = re.compile(r'\s*viewBox="(?P<viewbox>[^"]*)"')
+_SPRITE_OPEN = (
+    '<svg xmlns="http://www.w3.org/2000/svg" aria-hidden="true" '
+    'style="position:absolute;width:0;height:0;overflow:hidden">'
+)
+
+
+class IconSprite:
+    """SVG icons split into ``<symbol>`` definitions and ``<use>`` references.
+
+    Icons with identical artwork share one symbol. Call ``usage()`` once per
+    render to get the mapping templates index into.
+    """
+
+    def __init__(self, icons: Optional[dict] = None) -> None:
+        self.references: dict[str, str] = {}
+        self.symbol_ids: dict[str, str] = {}
+        self.symbols: dict[str, str] = {}
+        by_artwork: dict[tuple[str, str], str] = {}
+        for name, svg in (get_svg_icons() if icons is None else icons).items():
+            match = _SVG_RE.match(svg.strip())
+            if not match:
+                raise ValueError(f"Icon {name!r} is not a single <svg> element")
+            viewbox = _VIEWBOX_RE.search(match.group("attrs"))
+            artwork = (viewbox.group("viewbox") if viewbox else "", match.group("body"))
+            symbol_id = by_artwork.get(artwork)
+            if symbol_id is None:
+                symbol_id = by_artwork[artwork] = f"icon-{name}"
+                self.symbols[symbol_id] = (
+                    f'<symbol id="{symbol_id}" viewBox="{artwork[0]}">{artwork[1]}</symbol>'
+                )
+            attrs = _VIEWBOX_RE.sub("", match.group("attrs"))
+            self.symbol_ids[name] = symbol_id
+            self.references[name] = f'<svg{attrs}><use href="#{symbol_id}"></use></svg>'
+
+    def usage(self) -> "IconUsage":
+        return IconUsage(self)
+
+
+class IconUsage(Mapping):
+    """Per-render icon lookup that records which symbols the document needs."""
+
+    def __init__(self, sprite: IconSprite) -> None:
+        self._sprite = sprite
+        self._used: dict[str, None] = {}
+
+    def __getitem__(self, name: str) -> str:
+        reference = self._sprite.references[name]
+        self._used[self._sprite.symbol_ids[name]] = None
+        return reference
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._sprite.references)
+
+    def __len__(self) -> int:
+        return len(self._sprite.references)
+
+    def sprite(self) -> str:
+        """Return a hidden ``<svg>`` holding each referenced symbol exactly once."""
+        if not self._used:
+            return ""
+        symbols = "".join(self._sprite.symbols[symbol_id] for symbol_id in self._used)
+        return f"{_SPRITE_OPEN}{symbols}</svg>"
@@ -0,0 +1,40 @@
+"""Shared helpers for on-disk cache locations and in-memory cache statistics."""
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass
+from pathlib import Path
+
+_CACHE_ENV_KEY = "RESUME_CACHE_DIR"
+_CACHE_NAME = "py-resume"
+
+
+def resolve_cache_dir(*parts: str) -> Path:
+    """Return (and create) a cache directory, optionally nested under ``parts``.
+
+    ``RESUME_CACHE_DIR`` takes precedence, then ``XDG_CACHE_HOME`` and finally
+    ``~/.cache``.
+    """
+    explicit = os.environ.get(_CACHE_ENV_KEY)
+    if explicit:
+        root = Path(explicit).expanduser()
+    else:
+        xdg = os.environ.get("XDG_CACHE_HOME")
+        base = Path(xdg).expanduser() if xdg else Path.home() / ".cache"
+        root = base / _CACHE_NAME
+    target = root.joinpath(*parts)
+    target.mkdir(parents=True, exist_ok=True)
+    return target
+
+
+@dataclass
+class CacheStats:
+    """Hit/miss counters for an in-memory cache."""
+
+    hits: int = 0
+    misses: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
@@ -0,0 +1,115 @@
+"""Minification and unused-selector pruning for the inlined stylesheets."""
+from __future__ import annotations
+
+import re
+from collections.abc import Iterable, Iterator
+from typing import Optional
+
+_STRING_OR_COMMENT_RE = re.compile(r"(\"(?:\\.|[^\"\\])*\"|'(?:\\.|[^'\\])*')|/\*.*?\*/", re.DOTALL)
+_WHITESPACE_RE = re.compile(r"\s+")
+_PUNCTUATION_RE = re.compile(r"\s*([{};,>])\s*")
+_COLON_RE = re.compile(r":\s+")
+_PSEUDO_RE = re.compile(r"::?[\w-]+(?:\([^)]*\))?")
+_ATTRIBUTE_RE = re.compile(r"\[[^\]]*\]")
+_SIMPLE_SELECTOR_RE = re.compile(r"([.#]?)(-?[_a-zA-Z][\w-]*)")
+_TAG_RE = re.compile(r"<([a-zA-Z][\w-]*)")
+_CLASS_ATTR_RE = re.compile(r"\sclass=\"([^\"]*)\"")
+_ID_ATTR_RE = re.compile(r"\sid=\"([^\"]*)\"")
+# At-rules whose blocks hold style rules that can be pruned like top-level ones.
+_GROUPING_AT_RULES = ("@media", "@supports", "@layer")
+
+
+def minify_stylesheet(css: str) -> str:
+    """Strip comments and redundant whitespace without touching string literals."""
+    strings: list[str] = []
+
+    def stash(match: re.Match[str]) -> str:
+        if match.group(1) is None:
+            return " "
+        strings.append(match.group(1))
+        return f"\0{len(strings) - 1}\0"
+
+    text = _STRING_OR_COMMENT_RE.sub(stash, css)
+    text = _WHITESPACE_RE.sub(" ", text)
+    text = _PUNCTUATION_RE.sub(r"\1", text)
+    text = _COLON_RE.sub(":", text)
+    text = text.replace(";}", "}").strip()
+    return re.sub(r"\0(\d+)\0", lambda match: strings[int(match.group(1))], text)
+
+
+def _split_rules(css: str) -> Iterator[tuple[str, Optional[str]]]:
+    """Yield ``(prelude, block)`` for each top-level rule of minified ``css``.
+
+    ``block`` is ``None`` for block-less statements such as ``@import``.
+    """
+    start = 0
+    depth = 0
+    quote: Optional[str] = None
+    block_start = 0
+    for index, char in enumerate(css):
+        if quote:
+            if char == quote and css[index - 1] != "\\":
+                quote = None
+        elif char in "\"'":
+            quote = char
+        elif char == "{":
+            if depth == 0:
+                block_start = index
+            depth += 1
+        elif char == "}":
+            depth -= 1
+            if depth == 0:
+                yield css[start:block_start].strip(), css[block_start + 1 : index]
+                start = index + 1
+        elif char == ";" and depth == 0:
+            yield css[start:index].strip(), None
+            start = index + 1
+    if css[start:].strip():
+        yield css[start:].strip(), None
+
+
+def document_tokens(html: str) -> frozenset[str]:
+    """Return the tag names, ``.class`` and ``#id`` tokens present in ``html``."""
+    tokens = {tag.lower() for tag in _TAG_RE.findall(html)}
+    for value in _CLASS_ATTR_RE.findall(html):
+        tokens.update(f".{name}" for name in value.split())
+    tokens.update(f"#{value.strip()}" for value in _ID_ATTR_RE.findall(html))
+    return frozenset(tokens)
+
+
+def _selector_used(selector: str, tokens: frozenset[str]) -> bool:
+    """Approximate matching: every tag, class and id in ``selector`` must occur.
+
+    Pseudo-classes (including ``:not(...)``) and attribute selectors are
+    ignored, so the check only ever errs on the side of keeping a rule.
+    """
+    bare = _ATTRIBUTE_RE.sub("", _PSEUDO_RE.sub("", selector))
+    for prefix, name in _SIMPLE_SELECTOR_RE.findall(bare):
+        if (prefix + name if prefix else name.lower()) not in tokens:
+            return False
+    return True
+
+
+def _prune_rules(rules: Iterable[tuple[str, Optional[str]]], tokens: frozenset[str]) -> str:
+    kept = []
+    for prelude, block in rules:
+        if block is None:
+            kept.append(f"{prelude};")
+        elif prelude.startswith(_GROUPING_AT_RULES):
+            inner = _prune_rules(_split_rules(block), tokens)
+            if inner:
+                kept.append(f"{prelude}{{{inner}}}")
+        elif prelude.startswith("@"):
+            kept.append(f"{prelude}{{{block}}}")
+        else:
+            selectors = [
+                selector for selector in prelude.split(",") if _selector_used(selector, tokens)
+            ]
+            if selectors:
+                kept.append(f"{','.join(selectors)}{{{block}}}")
+    return "".join(kept)
+
+
+def prune_stylesheet(css: str, tokens: frozenset[str]) -> str:
+    """Minify ``css`` and drop selectors that cannot match a document with ``tokens``."""
+    return _prune_rules(_split_rules(minify_stylesheet(css)), tokens)
@@ -0,0 +1,211 @@
+"""Warm render daemon reachable over a Unix domain socket.
+
+The daemon keeps ``ResumeGenerator`` instances and a ``PdfRenderer`` resident,
+so repeated CLI invocations skip building the Jinja environment and starting
+Chromium. Requests and responses are single JSON lines. The server side
+imports the generator and loader lazily, so the client in ``request_daemon``
+stays cheap to import.
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import socket
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Optional
+
+from .cache import resolve_cache_dir
+from .pdf import PdfCache, PdfRenderer, _read_html_file
+
+if TYPE_CHECKING:
+    from .generator import ResumeGenerator
+
+_SOCKET_ENV_KEY = "RESUME_DAEMON_SOCKET"
+_SOCKET_NAME = "daemon.sock"
+_STREAM_LIMIT = 1024 * 1024
+_CONNECT_TIMEOUT_S = 2.0
+DEFAULT_RESPONSE_TIMEOUT_S = 120.0
+
+
+class DaemonError(RuntimeError):
+    """Raised when the daemon reports a failure for a request."""
+
+
+def daemon_supported() -> bool:
+    """Return whether this platform offers Unix domain sockets."""
+    return hasattr(socket, "AF_UNIX")
+
+
+def resolve_socket_path(explicit: Optional[Path] = None) -> Path:
+    """Return the socket path used by ``serve`` and the CLI client."""
+    if explicit:
+        return Path(explicit).expanduser()
+    value = os.environ.get(_SOCKET_ENV_KEY)
+    if value:
+        return Path(value).expanduser()
+    return resolve_cache_dir() / _SOCKET_NAME
+
+
+class RenderDaemon:
+    """Serve generate/full/pdf requests from a warm generator and browser."""
+
+    def __init__(self, socket_path: Optional[Path] = None, concurrency: int = 1) -> None:
+        self.socket_path = resolve_socket_path(socket_path)
+        self.renderer = PdfRenderer(max_pages=concurrency, cache=PdfCache())
+        self._generators: dict[tuple[Any, ...], ResumeGenerator] = {}
+        self._server: Optional[asyncio.Server] = None
+
+    async def start(self) -> None:
+        """Bind the socket, replacing a stale one left by a crashed daemon."""
+        if not daemon_supported():
+            raise RuntimeError("The render daemon requires Unix domain socket support.")
+        if self.socket_path.exists():
+            if request_daemon({"command": "ping"}, self.socket_path) is not None:
+                raise RuntimeError(f"A render daemon is already running at {self.socket_path}")
+            self.socket_path.unlink()
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+        self._server = await asyncio.start_unix_server(
+            self._handle_client,
+            path=str(self.socket_path),
+            limit=_STREAM_LIMIT,
+        )
+
+    async def serve_forever(self) -> None:
+        """Start the daemon and serve until cancelled."""
+        await self.start()
+        assert self._server is not None
+        try:
+            await self._server.serve_forever()
+        finally:
+            await self.close()
+
+    async def close(self) -> None:
+        """Stop accepting requests, close the browser and remove the socket."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        await self.renderer.close()
+        self.socket_path.unlink(missing_ok=True)
+
+    def _generator(self, request: dict[str, Any]) -> ResumeGenerator:
+        from .generator import ResumeGenerator, coerce_settings
+
+        settings = request.get("generator") or {}
+        key = tuple(sorted(settings.items()))
+        generator = self._generators.get(key)
+        if generator is None:
+            generator = ResumeGenerator(**coerce_settings(settings))
+            self._generators[key] = generator
+        return generator
+
+    async def _render_html(self, request: dict[str, Any]) -> str:
+        from .loader import load_resume_model
+
+        generator = self._generator(request)
+        resume = await asyncio.to_thread(load_resume_model, Path(request["input_file"]))
+        return await asyncio.to_thread(generator.generate_html, resume)
+
+    async def _write_html(self, request: dict[str, Any]) -> None:
+        from .loader import load_resume_model
+
+        generator = self._generator(request)
+        resume = await asyncio.to_thread(load_resume_model, Path(request["input_file"]))
+        output_path = Path(request["output_file"])
+        await asyncio.to_thread(generator.generate_html_file, resume, output_path)
+
+    async def _dispatch(self, request: dict[str, Any]) -> dict[str, Any]:
+        command = request.get("command")
+        if command == "ping":
+            return {}
+        if command == "generate":
+            await self._write_html(request)
+            return {}
+        if command == "full":
+            html_content = await self._render_html(request)
+            if request.get("output_file"):
+                Path(request["output_file"]).write_text(html_content, encoding="utf-8")
+            await self.renderer.render(
+                html_content,
+                Path(request["pdf_file"]),
+                use_cache=request.get("cache", True),
+                ready_timeout_ms=request.get("ready_timeout_ms"),
+            )
+            return {}
+        if command == "pdf":
+            html_content, base_uri = _read_html_file(Path(request["html_file"]))
+            await self.renderer.render(
+                html_content,
+                Path(request["output_file"]),
+                base_url=base_uri,
+                use_cache=request.get("cache", True),
+                ready_timeout_ms=request.get("ready_timeout_ms"),
+            )
+            return {}
+        raise ValueError(f"Unknown daemon command: {command!r}")
+
+    async def _handle_client(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+    ) -> None:
+        try:
+            line = await reader.readline()
+            try:
+                response = {"ok": True, **await self._dispatch(json.loads(line))}
+            except Exception as exc:
+                response = {"ok": False, "error": f"{type(exc).__name__}: {exc}"}
+            writer.write(json.dumps(response).encode("utf-8") + b"\n")
+            await writer.drain()
+        finally:
+            writer.close()
+            await writer.wait_closed()
+
+
+def request_daemon(
+    payload: dict[str, Any],
+    socket_path: Optional[Path] = None,
+    timeout: float = DEFAULT_RESPONSE_TIMEOUT_S,
+) -> Optional[dict[str, Any]]:
+    """Send ``payload`` to a running daemon and return its response.
+
+    Returns ``None`` when no daemon accepts the connection, so callers can
+    fall back to in-process rendering. Once the request is on its way the
+    daemon may already be writing the outputs, so a failure to answer within
+    ``timeout`` seconds raises ``DaemonError`` instead of inviting a second,
+    competing render. ``DaemonError`` is also raised if the daemon reports a
+    failure.
+    """
+    if not daemon_supported():
+        return None
+    path = resolve_socket_path(socket_path)
+    if not path.exists():
+        return None
+
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        client.settimeout(_CONNECT_TIMEOUT_S)
+        try:
+            client.connect(str(path))
+        except (ConnectionRefusedError, FileNotFoundError, TimeoutError):
+            return None
+        client.settimeout(timeout)
+        try:
+            client.sendall(json.dumps(payload).encode("utf-8") + b"\n")
+            with client.makefile("rb") as stream:
+                line = stream.readline()
+        except TimeoutError:
+            raise DaemonError(
+                f"The render daemon did not respond within {timeout:g} s; "
+                "it may still be writing the outputs."
+            ) from None
+    finally:
+        client.close()
+
+    if not line:
+        raise DaemonError("The render daemon closed the connection without responding.")
+    response = json.loads(line)
+    if not response.get("ok"):
+        raise DaemonError(response.get("error", "Unknown daemon error"))
+    return response
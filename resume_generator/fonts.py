@@ -0,0 +1,166 @@
+"""Local web font bundling with per-document glyph subsetting."""
+from __future__ import annotations
+
+import base64
+import io
+import os
+import re
+import urllib.request
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional
+from urllib.parse import quote_plus
+
+from .cache import resolve_cache_dir
+
+_FONT_ENV_KEY = "RESUME_FONT_DIR"
+_GOOGLE_FONTS_CSS = "https://fonts.googleapis.com/css2?family={query}"
+_FONT_FACE_RE = re.compile(r"@font-face\s*{(?P<body>[^}]*)}")
+_SRC_URL_RE = re.compile(r"src:\s*url\((?P<url>[^)]+)\)")
+
+
+@dataclass(frozen=True)
+class FontFace:
+    """A single weight/style of a web font family used by the templates."""
+
+    family: str
+    weight: int
+    style: str = "normal"
+
+    @property
+    def filename(self) -> str:
+        suffix = "Italic" if self.style == "italic" else ""
+        return f"{self.family.replace(' ', '')}-{self.weight}{suffix}.ttf"
+
+
+FONT_FACES: tuple[FontFace, ...] = (
+    *(
+        FontFace("Lato", weight, style)
+        for weight in (300, 400, 700)
+        for style in ("normal", "italic")
+    ),
+    FontFace("Josefin Sans", 300),
+    FontFace("Josefin Sans", 700),
+    *(FontFace("Roboto", weight) for weight in (300, 400, 500, 700)),
+)
+
+
+def resolve_font_dir(explicit: Optional[Path] = None) -> Path:
+    """Return the directory holding the vendored font files."""
+    if explicit:
+        return Path(explicit).expanduser().resolve()
+    value = os.environ.get(_FONT_ENV_KEY)
+    if value:
+        return Path(value).expanduser().resolve()
+    return resolve_cache_dir("fonts")
+
+
+def _family_query(family: str, faces: list[FontFace]) -> str:
+    axes = sorted({(int(face.style == "italic"), face.weight) for face in faces})
+    if any(italic for italic, _ in axes):
+        spec = ";".join(f"{italic},{weight}" for italic, weight in axes)
+        return f"{quote_plus(family)}:ital,wght@{spec}"
+    spec = ";".join(str(weight) for _, weight in axes)
+    return f"{quote_plus(family)}:wght@{spec}"
+
+
+def _css_value(body: str, name: str) -> Optional[str]:
+    match = re.search(rf"{name}\s*:\s*([^;]+);", body)
+    return match.group(1).strip().strip("'\"") if match else None
+
+
+def fetch_fonts(font_dir: Optional[Path] = None, *, force: bool = False) -> list[Path]:
+    """Download the template fonts from Google Fonts into ``font_dir``.
+
+    Google serves one complete TrueType file per face to clients that do not
+    advertise WOFF2 support, which is what the subsetter needs. Files already
+    present are kept unless ``force`` is set.
+    """
+    target_dir = resolve_font_dir(font_dir)
+    target_dir.mkdir(parents=True, exist_ok=True)
+
+    families: dict[str, list[FontFace]] = {}
+    for face in FONT_FACES:
+        families.setdefault(face.family, []).append(face)
+
+    written: list[Path] = []
+    for family, faces in families.items():
+        pending = [face for face in faces if force or not (target_dir / face.filename).exists()]
+        if not pending:
+            continue
+        url = _GOOGLE_FONTS_CSS.format(query=_family_query(family, faces))
+        with urllib.request.urlopen(url) as response:
+            css = response.read().decode("utf-8")
+
+        sources: dict[tuple[int, str], str] = {}
+        for block in _FONT_FACE_RE.finditer(css):
+            body = block.group("body")
+            src = _SRC_URL_RE.search(body)
+            weight = _css_value(body, "font-weight")
+            if not src or not weight:
+                continue
+            style = _css_value(body, "font-style") or "normal"
+            sources.setdefault((int(weight), style), src.group("url").strip("'\""))
+
+        for face in pending:
+            source = sources.get((face.weight, face.style))
+            if source is None:
+                raise ValueError(
+                    f"Google Fonts did not return {face.family} {face.weight} {face.style}"
+                )
+            with urllib.request.urlopen(source) as response:
+                data = response.read()
+            path = target_dir / face.filename
+            path.write_bytes(data)
+            written.append(path)
+    return written
+
+
+@lru_cache(maxsize=128)
+def _subset_woff2(font_path: str, mtime_ns: int, glyphs: str) -> bytes:
+    try:
+        from fontTools import subset
+        from fontTools.ttLib import TTFont
+    except ImportError as exc:
+        raise ImportError(
+            "Embedding fonts requires fontTools with WOFF2 support: "
+            "install 'fonttools[woff]' (or the 'fonts' extra)."
+        ) from exc
+
+    font = TTFont(font_path)
+    subsetter = subset.Subsetter(subset.Options())
+    subsetter.populate(text=glyphs)
+    subsetter.subset(font)
+    font.flavor = "woff2"
+    buffer = io.BytesIO()
+    font.save(buffer)
+    return buffer.getvalue()
+
+
+def build_font_css(text: str, font_dir: Optional[Path] = None) -> str:
+    """Return ``@font-face`` rules with every template font inlined as WOFF2.
+
+    Each font is subset to the characters in ``text``, so the document only
+    carries the glyphs it can actually display.
+    """
+    source_dir = resolve_font_dir(font_dir)
+    glyphs = "".join(sorted(set(text)))
+
+    rules = []
+    for face in FONT_FACES:
+        path = source_dir / face.filename
+        if not path.exists():
+            raise FileNotFoundError(
+                f"Font file not found: {path}. Run 'main.py fetch-fonts' to download it."
+            )
+        data = _subset_woff2(str(path), path.stat().st_mtime_ns, glyphs)
+        encoded = base64.b64encode(data).decode("ascii")
+        rules.append(
+            "@font-face{"
+            f"font-family:'{face.family}';font-style:{face.style};"
+            f"font-weight:{face.weight};font-display:block;"
+            f"src:url(data:font/woff2;base64,{encoded}) format('woff2')"
+            "}"
+        )
+    return "\n".join(rules)
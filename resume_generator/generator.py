@@ -1,14 +1,51 @@
 """HTML generation from resume data."""
-from datetime import datetime
+import functools
+import hashlib
+import json
+import os
+import string
+from datetime import date
+from html import unescape
 from pathlib import Path
 from textwrap import dedent
-from typing import Optional
+from typing import Any, Awaitable, Callable, Mapping, Optional, TextIO, get_type_hints
+from zipfile import BadZipFile, ZipFile
 
-from jinja2 import Environment, FileSystemLoader, select_autoescape
+from jinja2 import (
+    BaseLoader,
+    ChoiceLoader,
+    Environment,
+    FileSystemBytecodeCache,
+    FileSystemLoader,
+    ModuleLoader,
+    select_autoescape,
+)
 from jinja_markdown import MarkdownExtension
+from pydantic import TypeAdapter, ValidationError
 
-from .assets import get_image_as_data_uri, get_placeholder_avatar_data_uri, get_svg_icons
-from .models import Resume
+from .assets import AssetCache, IconSprite, get_placeholder_avatar_data_uri, get_svg_icons
+from .cache import CacheStats, resolve_cache_dir
+from .css import document_tokens, minify_stylesheet, prune_stylesheet
+from .fonts import FONT_FACES, build_font_css, resolve_font_dir
+from .markup import markdown_cache
+from .models import Resume, format_years, parse_date
+from .pdf import PdfRenderer, html_to_pdf
+
+_TEMPLATE_DIR = Path(__file__).parent / "templates"
+_REPO_ROOT = Path(__file__).resolve().parent.parent.parent
+_STATIC_DIR = Path(__file__).parent / "static"
+_CSS_FILES = (_STATIC_DIR / "paper.css", _STATIC_DIR / "styles.css")
+# ``ResumeGenerator`` arguments that are filesystem paths.
+PATH_SETTINGS = frozenset(
+    {"template_dir", "profile_photo", "font_dir", "compiled_templates", "working_dir"}
+)
+
+# Member of a compiled template archive naming the sources it was built from.
+_ARCHIVE_SOURCE_MEMBER = "py-resume-source.json"
+# Stands in for the stylesheet until the rendered document shows which rules it needs.
+_CSS_PLACEHOLDER = "/*py-resume:stylesheet*/"
+# Stands in for the embedded fonts until the rendered text shows which glyphs are needed.
+_FONT_PLACEHOLDER = "/*py-resume:fonts*/"
 
 DEFAULT_CV_FOOTER = dedent(
     """
@@ -24,32 +61,105 @@ DEFAULT_CV_FOOTER = dedent(
 ).strip()
 
 
-def _parse_date(value: Optional[str]) -> Optional[datetime]:
-    """Best-effort parser for ISO-like date strings."""
-    if not value:
-        return None
-    text = str(value).strip()
-    for fmt in ("%Y-%m-%d", "%Y-%m", "%Y"):
-        try:
-            return datetime.strptime(text, fmt)
-        except ValueError:
-            continue
-    try:
-        return datetime.fromisoformat(text)
-    except ValueError:
-        return None
-
+def calculate_years(
+    start_value: Optional[str],
+    end_value: Optional[str],
+    today: Optional[date] = None,
+) -> Optional[str]:
+    """Replicate React's rounded duration helper.
 
-def calculate_years(start_value: Optional[str], end_value: Optional[str]) -> Optional[str]:
-    """Replicate React's rounded duration helper."""
-    start_date = _parse_date(start_value)
+    Templates should prefer the ``duration(today)`` method of the date-range
+    models, which does not re-parse the dates on every render.
+    """
+    start_date = parse_date(start_value)
     if not start_date:
         return None
-    end_date = _parse_date(end_value) or datetime.now()
-    diff_days = (end_date - start_date).days
-    years = diff_days / 365
-    rounded = round(years * 2) / 2
-    return f"{rounded:.1f}"
+    return format_years(start_date, parse_date(end_value) or today or date.today())
+
+
+class _AsyncMarkdownExtension(MarkdownExtension):
+    """``{% markdown %}`` for async environments, where ``caller()`` is awaitable.
+
+    The tag's parser dispatches to ``_render_markdown``, so that is the one
+    hook overridden. The conversion goes through the shared ``markdown_cache``,
+    which uses the same extensions, instead of the converter the base class
+    stores on the environment.
+    """
+
+    async def _render_markdown(self, caller: Callable[[], Awaitable[str]]) -> str:
+        text = dedent((await caller()).strip("\n"))
+        return markdown_cache.convert(text)
+
+
+def _build_environment(
+    loader: BaseLoader,
+    bytecode_cache_dir: Optional[Path] = None,
+    enable_async: bool = False,
+) -> Environment:
+    bytecode_cache = (
+        FileSystemBytecodeCache(str(bytecode_cache_dir)) if bytecode_cache_dir else None
+    )
+    env = Environment(
+        loader=loader,
+        autoescape=select_autoescape(['html', 'xml']),
+        extensions=[_AsyncMarkdownExtension if enable_async else MarkdownExtension],
+        bytecode_cache=bytecode_cache,
+        enable_async=enable_async,
+    )
+    env.globals["calc_years"] = calculate_years
+    env.filters["markdown"] = markdown_cache.filter
+    return env
+
+
+def _template_digest(template_dir: Path) -> str:
+    """Hash the names and contents of every file under ``template_dir``."""
+    digest = hashlib.sha256()
+    for path in sorted(path for path in template_dir.rglob("*") if path.is_file()):
+        content = hashlib.sha256(path.read_bytes()).hexdigest()
+        digest.update(f"{path.relative_to(template_dir).as_posix()}\0{content}\n".encode())
+    return digest.hexdigest()
+
+
+def compile_templates(template_dir: Optional[Path], target: Path) -> Path:
+    """Precompile every template in ``template_dir`` into an importable zip archive.
+
+    Pass the archive to ``ResumeGenerator(compiled_templates=...)`` to render
+    without parsing or compiling any template source. The archive records the
+    template directory and a hash of its files, and the generator rejects it
+    once either no longer matches, so recompile after editing the templates.
+    """
+    source_dir = _TEMPLATE_DIR if template_dir is None else Path(template_dir)
+    if not source_dir.is_dir():
+        raise NotADirectoryError(f"Template directory is not a directory: {source_dir}")
+    target = Path(target)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    env = _build_environment(FileSystemLoader(str(source_dir)))
+    env.compile_templates(str(target), zip="deflated", ignore_errors=False)
+    source = {"template_dir": str(source_dir.resolve()), "sha256": _template_digest(source_dir)}
+    with ZipFile(target, "a") as archive:
+        archive.writestr(_ARCHIVE_SOURCE_MEMBER, json.dumps(source))
+    return target
+
+
+def _check_compiled_templates(archive: Path, template_dir: Path) -> None:
+    """Raise ``ValueError`` unless ``archive`` was compiled from ``template_dir`` as it is now."""
+    try:
+        with ZipFile(archive) as bundle:
+            source = json.loads(bundle.read(_ARCHIVE_SOURCE_MEMBER))
+    except (BadZipFile, KeyError, ValueError):
+        raise ValueError(
+            f"Compiled templates {archive} were not built by compile-templates; recompile them"
+        ) from None
+    expected = str(template_dir.resolve())
+    if source.get("template_dir") != expected:
+        raise ValueError(
+            f"Compiled templates {archive} were built from {source.get('template_dir')}, "
+            f"not {expected}; pass the matching --template-dir or recompile them"
+        )
+    if source.get("sha256") != _template_digest(template_dir):
+        raise ValueError(
+            f"Compiled templates {archive} are out of date with {template_dir}; recompile them"
+        )
 
 
 class ResumeGenerator:
@@ -59,27 +169,188 @@ class ResumeGenerator:
         self,
         template_dir: Optional[Path] = None,
         profile_photo: Optional[Path] = None,
+        embed_fonts: bool = False,
+        font_dir: Optional[Path] = None,
+        bytecode_cache: bool = False,
+        compiled_templates: Optional[Path] = None,
+        icon_sprite: bool = False,
+        photo_dpi: Optional[int] = None,
+        minify_css: bool = False,
+        prune_css: bool = False,
+        today: Optional[date] = None,
+        show_photo: bool = True,
+        working_dir: Optional[Path] = None,
     ) -> None:
         """Initialize the generator.
 
         Args:
             template_dir: Path to templates directory. Defaults to package templates.
             profile_photo: Optional override path for the profile image.
+            embed_fonts: Inline subset WOFF2 fonts instead of linking Google Fonts.
+            font_dir: Directory with the vendored font files (see ``fetch-fonts``).
+            bytecode_cache: Persist compiled template bytecode in the cache directory.
+            compiled_templates: Archive from ``compile_templates`` to load templates from.
+            icon_sprite: Reference icons via ``<use>`` from one hidden SVG sprite
+                instead of repeating the full inline SVG at every occurrence.
+            photo_dpi: Downscale and re-encode local photos for this print
+                resolution instead of embedding the original file.
+            minify_css: Inline the stylesheets without comments and whitespace.
+            prune_css: Additionally drop rules whose selectors match nothing in
+                the rendered document.
+            today: Reference date for open-ended durations. Defaults to the
+                current date at each render; pin it to make output reproducible.
+            show_photo: Render the profile picture (or its placeholder).
+            working_dir: Directory that a relative ``basics.picture`` and the
+                ``public/profile.jpg`` fallback are resolved against. Defaults
+                to the current directory at each render.
         """
 
-        self.template_dir = (
-            Path(__file__).parent / "templates"
-            if template_dir is None
-            else Path(template_dir)
-        )
+        self.template_dir = _TEMPLATE_DIR if template_dir is None else Path(template_dir)
         self.profile_photo = Path(profile_photo) if profile_photo else None
+        self.embed_fonts = embed_fonts
+        self.font_dir = Path(font_dir) if font_dir else None
+        self.compiled_templates = Path(compiled_templates) if compiled_templates else None
+        self.photo_dpi = photo_dpi
+        self.minify_css = minify_css
+        self.prune_css = prune_css
+        self.today = today
+        self.show_photo = show_photo
+        self.working_dir = Path(working_dir) if working_dir else None
 
-        self.env = Environment(
-            loader=FileSystemLoader(str(self.template_dir)),
-            autoescape=select_autoescape(['html', 'xml']),
-            extensions=[MarkdownExtension]
+        self.assets = AssetCache()
+        self._icons = get_svg_icons()
+        self._sprite = IconSprite(self._icons) if icon_sprite else None
+        self._placeholder_uri = get_placeholder_avatar_data_uri()
+
+        loader: BaseLoader = FileSystemLoader(str(self.template_dir))
+        if compiled_templates:
+            archive = Path(compiled_templates)
+            if not archive.exists():
+                raise FileNotFoundError(f"Compiled templates not found: {archive}")
+            _check_compiled_templates(archive, self.template_dir)
+            loader = ChoiceLoader([ModuleLoader(str(archive)), loader])
+        self.env = _build_environment(
+            loader,
+            resolve_cache_dir("jinja") if bytecode_cache else None,
         )
-        self.env.globals["calc_years"] = calculate_years
+        self._bytecode_cache = bytecode_cache
+        self._async_env: Optional[Environment] = None
+
+    def _working_dir(self) -> Path:
+        # Read per render, as the process may change directory in between.
+        return self.working_dir or Path.cwd()
+
+    def _photo_candidates(self) -> list[Path]:
+        # Mirror React's public/profile.jpg lookup after the explicit override.
+        return [
+            *([self.profile_photo] if self.profile_photo else []),
+            _REPO_ROOT / "public" / "profile.jpg",
+            self._working_dir() / "public" / "profile.jpg",
+        ]
+
+    @property
+    def asset_stats(self) -> CacheStats:
+        """Hit/miss counters of the stylesheet and image cache."""
+        return self.assets.stats
+
+    @property
+    def markdown_stats(self) -> CacheStats:
+        """Hit/miss counters of the process-wide Markdown cache."""
+        return markdown_cache.stats
+
+    def dependency_paths(self) -> list[Path]:
+        """Return the files besides the resume data that the rendered HTML depends on."""
+        paths = sorted(path for path in self.template_dir.rglob("*") if path.is_file())
+        paths.extend(_CSS_FILES)
+        if self.compiled_templates:
+            paths.append(self.compiled_templates)
+        paths.extend(candidate for candidate in self._photo_candidates() if candidate.is_file())
+        if self.embed_fonts:
+            font_dir = resolve_font_dir(self.font_dir)
+            paths.extend(font_dir / face.filename for face in FONT_FACES)
+        return paths
+
+    def _css_content(self) -> str:
+        return self.assets.get(
+            "css",
+            _CSS_FILES,
+            lambda: "\n\n".join(path.read_text(encoding="utf-8") for path in _CSS_FILES),
+        )
+
+    def _minified_stylesheet(self) -> str:
+        return self.assets.get(
+            "css-min", _CSS_FILES, lambda: minify_stylesheet(self._css_content())
+        )
+
+    def _stylesheet(self) -> str:
+        return self._minified_stylesheet() if self.minify_css else self._css_content()
+
+    def _pruned_stylesheet(self, html: str) -> str:
+        """Return the stylesheet reduced to what ``html`` uses, cached per token set."""
+        tokens = document_tokens(html)
+        return self.assets.get(
+            ("css-pruned", tokens),
+            _CSS_FILES,
+            lambda: prune_stylesheet(self._css_content(), tokens),
+        )
+
+    def _picture_url(self, resume: Resume) -> str:
+        for candidate in self._photo_candidates():
+            data_uri = self.assets.image_data_uri(candidate, self.photo_dpi)
+            if data_uri:
+                return data_uri
+
+        local = self.picture_file(resume)
+        if local is not None:
+            data_uri = self.assets.image_data_uri(local, self.photo_dpi)
+            if data_uri:
+                return data_uri
+
+        return resume.basics.picture or self._placeholder_uri
+
+    def picture_file(self, resume: Resume) -> Optional[Path]:
+        """Return the local file that ``basics.picture`` names, if it exists.
+
+        Unlike ``dependency_paths`` this depends on the resume, so callers that
+        track what a render read must check it per record.
+        """
+        picture = resume.basics.picture
+        if not picture:
+            return None
+        # URLs never exist on disk, so joining them is harmless.
+        local = self._working_dir() / picture
+        return local if local.is_file() else None
+
+    def _font_css(self, html: str) -> str:
+        # Subset to the rendered text, which includes what filters such as
+        # Markdown's smart quotes and symbols produced from the resume strings.
+        return build_font_css(string.printable + unescape(html), self.font_dir)
+
+    def _finish_document(self, html: str) -> str:
+        """Replace the placeholders whose content depends on the rendered document."""
+        if self.embed_fonts:
+            html = html.replace(_FONT_PLACEHOLDER, self._font_css(html), 1)
+        if self.prune_css:
+            html = html.replace(_CSS_PLACEHOLDER, self._pruned_stylesheet(html), 1)
+        return html
+
+    def _render_context(self, resume: Resume, css_content: str) -> dict[str, Any]:
+        font_css = _FONT_PLACEHOLDER if self.embed_fonts else None
+        icons: Mapping[str, str] = self._icons
+        icon_sprite = None
+        if self._sprite is not None:
+            usage = self._sprite.usage()
+            icons, icon_sprite = usage, usage.sprite
+        return {
+            "resume": resume,
+            "css_content": css_content,
+            "icons": icons,
+            "icon_sprite": icon_sprite,
+            "picture_url": self._picture_url(resume) if self.show_photo else None,
+            "cv_footer_text": resume.cvFooter or DEFAULT_CV_FOOTER,
+            "font_css": font_css,
+            "today": self.today or date.today(),
+        }
 
     def generate_html(self, resume: Resume) -> str:
         """Generate HTML from resume data.
@@ -90,68 +361,124 @@ class ResumeGenerator:
         Returns:
             Complete HTML string with inlined CSS and fonts
         """
-        # Read CSS file and inline it
-        static_dir = Path(__file__).parent / "static"
-        styles_path = static_dir / "styles.css"
-        paper_css_path = static_dir / "paper.css"
+        template = self.env.get_template("resume.html")
+        css_content = _CSS_PLACEHOLDER if self.prune_css else self._stylesheet()
+        html = template.render(**self._render_context(resume, css_content))
+        return self._finish_document(html)
 
-        with open(paper_css_path, 'r', encoding='utf-8') as paper_file:
-            paper_css = paper_file.read()
+    def stream_html(self, resume: Resume, stream: TextIO) -> None:
+        """Render HTML chunk by chunk into a writable text stream.
 
-        with open(styles_path, 'r', encoding='utf-8') as styles_file:
-            styles_css = styles_file.read()
+        The document is never held in memory as a whole. Pruning needs the
+        complete document, so with ``prune_css`` the stylesheet is only
+        minified here. Embedded fonts are subset to the rendered text, so with
+        ``embed_fonts`` the document is rendered in memory and written at once.
 
-        css_content = f"{paper_css}\n\n{styles_css}"
+        Args:
+            resume: Resume data model
+            stream: Text stream to write the HTML to
+        """
+        if self.embed_fonts:
+            stream.write(self.generate_html(resume))
+            return
+        template = self.env.get_template("resume.html")
+        css_content = self._minified_stylesheet() if self.prune_css else self._stylesheet()
+        for chunk in template.generate(**self._render_context(resume, css_content)):
+            stream.write(chunk)
 
-        # Get SVG icons
-        icons = get_svg_icons()
-        
-        # Process picture - try matching React's public/profile.jpg
-        package_dir = Path(__file__).resolve().parent
-        repo_root = package_dir.parent.parent
-        candidate_paths = []
-        if self.profile_photo:
-            candidate_paths.append(self.profile_photo)
-        candidate_paths.extend([
-            repo_root / "public" / "profile.jpg",
-            Path.cwd() / "public" / "profile.jpg",
-        ])
-
-        picture_url = None
-        for candidate in candidate_paths:
-            data_uri = get_image_as_data_uri(candidate)
-            if data_uri:
-                picture_url = data_uri
-                break
+    @property
+    def async_env(self) -> Environment:
+        """Jinja environment compiled for ``render_async``, created on first use.
 
-        if not picture_url and resume.basics.picture:
-            picture_url = get_image_as_data_uri(resume.basics.picture) or resume.basics.picture
+        Precompiled archives hold synchronous code, so this environment always
+        loads template sources, and its bytecode is cached separately.
+        """
+        if self._async_env is None:
+            self._async_env = _build_environment(
+                FileSystemLoader(str(self.template_dir)),
+                resolve_cache_dir("jinja", "async") if self._bytecode_cache else None,
+                enable_async=True,
+            )
+        return self._async_env
 
-        if not picture_url:
-            picture_url = get_placeholder_avatar_data_uri()
+    async def generate_html_async(self, resume: Resume) -> str:
+        """Async variant of ``generate_html`` that yields to the event loop while rendering."""
+        template = self.async_env.get_template("resume.html")
+        css_content = _CSS_PLACEHOLDER if self.prune_css else self._stylesheet()
+        html = await template.render_async(**self._render_context(resume, css_content))
+        return self._finish_document(html)
 
-        # Load template
-        template = self.env.get_template("resume.html")
+    async def render_resume(
+        self,
+        resume: Resume,
+        renderer: Optional[PdfRenderer] = None,
+        use_cache: bool = True,
+    ) -> tuple[str, bytes]:
+        """Render ``resume`` to HTML and PDF without leaving the event loop.
 
-        # Render template
-        html = template.render(
-            resume=resume,
-            css_content=css_content,
-            icons=icons,
-            picture_url=picture_url,
-            cv_footer_text=resume.cvFooter or DEFAULT_CV_FOOTER,
-        )
+        Pass a shared ``PdfRenderer`` to run many renders concurrently on one
+        browser; otherwise a browser is started for this call.
 
-        return html
+        Returns:
+            The HTML document and the PDF bytes
+        """
+        html = await self.generate_html_async(resume)
+        if renderer is None:
+            pdf = await html_to_pdf(html, use_cache=use_cache)
+        else:
+            pdf = await renderer.render(html, use_cache=use_cache)
+        return html, pdf
 
     def generate_html_file(self, resume: Resume, output_path: Path) -> None:
         """Generate HTML file from resume data.
+
+        The document is streamed to disk unless ``prune_css`` or
+        ``embed_fonts`` is set, which need the complete document before the
+        stylesheet or the fonts can be written. It
+        goes to a sibling staging file that replaces ``output_path`` only once
+        rendering succeeded, so a failure never leaves a truncated document.
         
         Args:
             resume: Resume data model
             output_path: Path where to write the HTML file
         """
-        html = self.generate_html(resume)
         output_path = Path(output_path)
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        output_path.write_text(html, encoding='utf-8')
+        staging = output_path.with_name(f"{output_path.name}.{os.getpid()}.tmp")
+        try:
+            if self.prune_css or self.embed_fonts:
+                staging.write_text(self.generate_html(resume), encoding='utf-8')
+            else:
+                with staging.open('w', encoding='utf-8') as stream:
+                    self.stream_html(resume, stream)
+            os.replace(staging, output_path)
+        finally:
+            staging.unlink(missing_ok=True)
+
+
+@functools.cache
+def _setting_adapters() -> dict[str, TypeAdapter[Any]]:
+    hints = get_type_hints(ResumeGenerator.__init__)
+    hints.pop("return", None)
+    return {name: TypeAdapter(hint) for name, hint in hints.items()}
+
+
+def coerce_settings(settings: Mapping[str, Any]) -> dict[str, Any]:
+    """Validate ``ResumeGenerator`` keyword arguments read from JSON, YAML or a socket.
+
+    Values are converted to the parameter types, so ``"2025-01-01"`` becomes a
+    ``date`` and path strings become ``Path`` objects. Unknown names and values
+    that do not fit their parameter raise ``ValueError``.
+    """
+    adapters = _setting_adapters()
+    unknown = settings.keys() - adapters.keys()
+    if unknown:
+        raise ValueError(f"Unknown generator setting(s): {', '.join(sorted(unknown))}")
+    coerced = {}
+    for name, value in settings.items():
+        try:
+            coerced[name] = adapters[name].validate_python(value)
+        except ValidationError as exc:
+            reason = exc.errors()[0]["msg"]
+            raise ValueError(f"Invalid value for setting {name!r}: {value!r} ({reason})") from None
+    return coerced
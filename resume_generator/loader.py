@@ -1,24 +1,168 @@
 """Input helpers for loading resume data."""
 from __future__ import annotations
 
+import codecs
+import hashlib
 import json
+import os
+import pickle
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from types import UnionType
+from typing import Any, Callable, Iterator, Optional, TypeVar, Union, get_args, get_origin
 
+import pydantic
 import yaml
+from pydantic import BaseModel, TypeAdapter, ValidationError
 
+from . import models
+from .cache import CacheStats, resolve_cache_dir
 from .models import Resume
 
+try:
+    import orjson  # ty: ignore[unresolved-import]  # optional "json" extra
+except ImportError:
+    orjson = None
+
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
 _JSON_SUFFIXES = {".json"}
 _YAML_SUFFIXES = {".yaml", ".yml"}
+JSON_LINES_SUFFIXES = {".jsonl", ".ndjson"}
+_RESUME_BATCH = TypeAdapter(list[Resume])
+JSON_BACKEND = "orjson" if orjson is not None else "json"
+YAML_BACKEND = "libyaml" if _YamlLoader.__name__ == "CSafeLoader" else "pyyaml"
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
 
+def parser_backends() -> dict[str, str]:
+    """Return the parser used for each input format, for diagnostics."""
+    return {"json": JSON_BACKEND, "yaml": YAML_BACKEND}
 
-def _load_json(text: str) -> Any:
+
+def _load_json(text: Union[str, bytes]) -> Any:
+    if orjson is not None:
+        return orjson.loads(text)
     return json.loads(text)
 
 
 def _load_yaml(text: str) -> Any:
-    return yaml.safe_load(text)
+    return yaml.load(text, Loader=_YamlLoader)
+
+
+def _sniff_format(text: Union[str, bytes]) -> str:
+    """Guess the format from the first significant character.
+
+    JSON documents are objects or arrays, so anything else is treated as YAML.
+    """
+    if isinstance(text, bytes):
+        text = text.removeprefix(codecs.BOM_UTF8).lstrip()[:1].decode("ascii", "replace")
+    stripped = text.lstrip("\ufeff \t\r\n")
+    return "json" if stripped[:1] in ("{", "[") else "yaml"
+
+
+def _is_json_syntax_error(exc: ValidationError) -> bool:
+    return any(error["type"] == "json_invalid" for error in exc.errors())
+
+
+def _validate_content(content: bytes, path: Path) -> Resume:
+    """Validate raw file bytes, letting pydantic parse JSON without a dict detour."""
+    content = content.removeprefix(codecs.BOM_UTF8)
+    suffix = path.suffix.lower()
+    if suffix in _YAML_SUFFIXES:
+        return Resume.model_validate(_load_yaml(content.decode("utf-8")))
+    if suffix in _JSON_SUFFIXES:
+        return Resume.model_validate_json(content)
+    if _sniff_format(content) == "json":
+        try:
+            return Resume.model_validate_json(content)
+        except ValidationError as exc:
+            # Only a syntax error (e.g. a YAML flow mapping) is retried as YAML.
+            if not _is_json_syntax_error(exc):
+                raise
+    try:
+        data = _load_yaml(content.decode("utf-8"))
+    except yaml.YAMLError as exc:
+        raise ValueError(f"Could not parse resume data from {path} as JSON or YAML") from exc
+    return Resume.model_validate(data)
+
+
+def validate_resumes(
+    data: Union[bytes, str, list[Any]],
+    trusted: bool = False,
+) -> list[Resume]:
+    """Validate many resumes in one call through a shared ``TypeAdapter``.
+
+    A JSON array given as text or bytes is parsed by pydantic directly, so no
+    intermediate dict graph is built; already-parsed lists are validated as-is.
+    With ``trusted`` the resumes are built by ``construct_resume`` instead.
+    """
+    if trusted:
+        items = _load_json(data) if isinstance(data, (bytes, str)) else data
+        if not isinstance(items, list):
+            raise ValueError("Expected a list of resumes")
+        return [construct_resume(item) for item in items]
+    if isinstance(data, (bytes, str)):
+        return _RESUME_BATCH.validate_json(data)
+    return _RESUME_BATCH.validate_python(data)
+
+
+@lru_cache(maxsize=None)
+def _construction_plan(
+    model: type[BaseModel],
+) -> tuple[tuple[str, Optional[type[BaseModel]], bool, bool], ...]:
+    """Return ``(name, nested model, is list, required)`` for each field of ``model``."""
+    plan = []
+    for name, field in model.model_fields.items():
+        annotation = field.annotation
+        if get_origin(annotation) in (Union, UnionType):
+            annotation = next(arg for arg in get_args(annotation) if arg is not type(None))
+        is_list = get_origin(annotation) is list
+        if is_list:
+            annotation = get_args(annotation)[0]
+        nested = None
+        if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+            nested = annotation
+        plan.append((name, nested, is_list, field.is_required()))
+    return tuple(plan)
+
+
+def _construct(model: type[ModelT], data: Any, location: str) -> ModelT:
+    if not isinstance(data, dict):
+        raise ValueError(f"{location}: expected a mapping, got {type(data).__name__}")
+    values: dict[str, Any] = {}
+    for name, nested, is_list, required in _construction_plan(model):
+        if name not in data:
+            if required:
+                raise ValueError(f"{location}: missing required field {name!r}")
+            continue
+        value = data[name]
+        if nested is not None and value is not None:
+            if is_list:
+                if not isinstance(value, list):
+                    raise ValueError(f"{location}.{name}: expected a list")
+                value = [
+                    _construct(nested, item, f"{location}.{name}[{index}]")
+                    for index, item in enumerate(value)
+                ]
+            else:
+                value = _construct(nested, value, f"{location}.{name}")
+        values[name] = value
+    return model.model_construct(**values)
+
+
+def construct_resume(data: Any) -> Resume:
+    """Build a ``Resume`` from trusted, already-validated data without validation.
+
+    Only the structure is checked: mappings where models are expected and the
+    required fields present. Field values are taken as-is, so use this only for
+    data a previous validating load produced.
+    """
+    return _construct(Resume, data, "resume")
 
 
 def load_resume_data(path: Path) -> Any:
@@ -26,7 +170,10 @@ def load_resume_data(path: Path) -> Any:
     if not path.exists():
         raise FileNotFoundError(f"Resume file not found: {path}")
 
-    text = path.read_text(encoding="utf-8")
+    return _parse_text(path.read_text(encoding="utf-8"), path)
+
+
+def _parse_text(text: str, path: Path) -> Any:
     suffix = path.suffix.lower()
 
     if suffix in _JSON_SUFFIXES:
@@ -34,11 +181,13 @@ def load_resume_data(path: Path) -> Any:
     if suffix in _YAML_SUFFIXES:
         return _load_yaml(text)
 
-    # Fallback: try JSON then YAML regardless of extension.
-    try:
-        return _load_json(text)
-    except json.JSONDecodeError:
-        pass
+    # Unknown extension: sniff the content so it is parsed once. Only a sniffed
+    # JSON document that fails to parse (e.g. a YAML flow mapping) is retried.
+    if _sniff_format(text) == "json":
+        try:
+            return _load_json(text)
+        except json.JSONDecodeError:
+            pass
 
     try:
         return _load_yaml(text)
@@ -46,7 +195,176 @@ def load_resume_data(path: Path) -> Any:
         raise ValueError(f"Could not parse resume data from {path} as JSON or YAML") from exc
 
 
-def load_resume_model(path: Path) -> Resume:
-    """Load and validate resume data returning a `Resume` model."""
-    data = load_resume_data(path)
-    return Resume(**data)
+@lru_cache(maxsize=1)
+def _schema_version() -> str:
+    """Fingerprint of the model definitions; any edit to them changes it."""
+    digest = hashlib.sha256(pydantic.VERSION.encode())
+    digest.update(Path(models.__file__).read_bytes())
+    return digest.hexdigest()[:16]
+
+
+class ModelCache:
+    """On-disk cache of validated ``Resume`` models.
+
+    Entries are pickles keyed by a hash of the input file's bytes, stored under
+    a directory named after the model schema version, so editing the models
+    (or upgrading pydantic) invalidates every entry. Only point it at a
+    directory you trust: loading a pickle can execute code.
+    """
+
+    def __init__(self, directory: Optional[Path] = None) -> None:
+        root = Path(directory) if directory else resolve_cache_dir("models")
+        self.directory = root / _schema_version()
+        self.stats = CacheStats()
+
+    @staticmethod
+    def key(content: bytes) -> str:
+        return hashlib.sha256(content).hexdigest()
+
+    @staticmethod
+    def file_key(path: Path) -> str:
+        """Same as ``key(path.read_bytes())`` without holding the file in memory."""
+        with path.open("rb") as stream:
+            return hashlib.file_digest(stream, "sha256").hexdigest()
+
+    def _entry(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.pickle"
+
+    def get(self, key: str) -> Optional[Resume]:
+        """Return the cached model for ``key`` or ``None`` on a miss."""
+        try:
+            with self._entry(key).open("rb") as stream:
+                resume = pickle.load(stream)
+        except (FileNotFoundError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            # Truncated or unreadable entries behave like misses and get rewritten.
+            self.stats.misses += 1
+            return None
+        self.stats.hits += 1
+        return resume
+
+    def put(self, key: str, resume: Resume) -> None:
+        entry = self._entry(key)
+        entry.parent.mkdir(parents=True, exist_ok=True)
+        staging = entry.with_name(f"{entry.name}.{os.getpid()}.tmp")
+        staging.write_bytes(pickle.dumps(resume, protocol=pickle.HIGHEST_PROTOCOL))
+        os.replace(staging, entry)
+
+
+def load_resume_model(
+    path: Path,
+    cache: Optional[ModelCache] = None,
+    trusted: bool = False,
+) -> Resume:
+    """Load and validate resume data returning a `Resume` model.
+
+    JSON input is validated straight from the file bytes. With a
+    ``ModelCache``, unchanged files skip parsing and validation. ``trusted``
+    skips validation for input that has already been validated elsewhere
+    (see ``construct_resume``); the cache is still consulted, but models
+    built without validation are never stored in it.
+    """
+    if not path.exists():
+        raise FileNotFoundError(f"Resume file not found: {path}")
+    content = path.read_bytes()
+    if cache is None:
+        return _build(content, path, trusted)
+
+    key = cache.key(content)
+    resume = cache.get(key)
+    if resume is None:
+        resume = _build(content, path, trusted)
+        if not trusted:
+            cache.put(key, resume)
+    return resume
+
+
+def _build(content: bytes, path: Path, trusted: bool) -> Resume:
+    if trusted:
+        return construct_resume(_parse_text(content.decode("utf-8"), path))
+    return _validate_content(content, path)
+
+
+def _record(path: Path, number: int, build: Callable[[], Resume]) -> Resume:
+    try:
+        return build()
+    except ValueError as exc:
+        exc.add_note(f"while loading record {number} of {path}")
+        raise
+
+
+def _iter_json_lines(
+    path: Path,
+    cache: Optional[ModelCache],
+    trusted: bool,
+) -> Iterator[Resume]:
+    with path.open("rb") as stream:
+        for number, line in enumerate(stream, start=1):
+            if not line.strip():
+                continue
+            key = cache.key(line.strip()) if cache else None
+            resume = cache.get(key) if cache and key else None
+            if resume is None and trusted:
+                resume = _record(path, number, lambda: construct_resume(_load_json(line)))
+            elif resume is None:
+                resume = _record(path, number, lambda: Resume.model_validate_json(line))
+                if cache and key:
+                    cache.put(key, resume)
+            yield resume
+
+
+def _iter_yaml_documents(
+    path: Path,
+    cache: Optional[ModelCache],
+    trusted: bool,
+) -> Iterator[Resume]:
+    # Only single-document files are cached; streams are always re-read lazily.
+    key = cache.file_key(path) if cache else None
+    if cache and key:
+        cached = cache.get(key)
+        if cached is not None:
+            yield cached
+            return
+
+    first: Optional[Resume] = None
+    count = 0
+    # YAML syntax errors already carry the line and column of the problem.
+    with path.open(encoding="utf-8") as stream:
+        documents = yaml.load_all(stream, Loader=_YamlLoader)
+        for number, data in enumerate(documents, start=1):
+            if data is None:
+                continue
+            if trusted:
+                resume = _record(path, number, lambda: construct_resume(data))
+            else:
+                resume = _record(path, number, lambda: Resume.model_validate(data))
+            count += 1
+            if count == 1:
+                first = resume
+            yield resume
+    if cache and key and count == 1 and first is not None and not trusted:
+        cache.put(key, first)
+
+
+def iter_resume_records(
+    path: Path,
+    cache: Optional[ModelCache] = None,
+    trusted: bool = False,
+) -> Iterator[Resume]:
+    """Lazily yield every resume stored in ``path``.
+
+    JSON Lines files (``.jsonl``/``.ndjson``) hold one resume per line and YAML
+    files may hold a stream of ``---``-separated documents. Both are read
+    record by record, so memory use does not grow with the file. Any other
+    file yields its single resume. Validation errors name the failing record.
+    A ``ModelCache`` is consulted per JSON line and per single-document file,
+    and only filled by validating loads.
+    """
+    suffix = path.suffix.lower()
+    if not path.exists():
+        raise FileNotFoundError(f"Resume file not found: {path}")
+    if suffix in JSON_LINES_SUFFIXES:
+        yield from _iter_json_lines(path, cache, trusted)
+    elif suffix in _YAML_SUFFIXES:
+        yield from _iter_yaml_documents(path, cache, trusted)
+    else:
+        yield load_resume_model(path, cache, trusted=trusted)
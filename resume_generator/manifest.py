@@ -0,0 +1,151 @@
+"""Dependency manifest that lets ``full-many`` skip resumes whose inputs are unchanged."""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from datetime import date
+from importlib import metadata
+from pathlib import Path
+from typing import Any, Iterable, Optional
+
+from .generator import ResumeGenerator
+from .models import Resume, format_years
+from .pdf import engine_version
+
+MANIFEST_NAME = ".py-resume-manifest.json"
+_MANIFEST_VERSION = 2
+_PACKAGE_DIR = Path(__file__).resolve().parent
+
+Outputs = list[tuple[Optional[Path], Path]]
+
+
+def file_hash(path: Path) -> str:
+    """Return the sha256 of ``path`` without reading it into memory at once."""
+    with Path(path).open("rb") as stream:
+        return hashlib.file_digest(stream, "sha256").hexdigest()
+
+
+def _tool_version() -> str:
+    try:
+        version = metadata.version("py-resume")
+    except metadata.PackageNotFoundError:
+        version = "unknown"
+    return f"py-resume-{version}|{engine_version()}"
+
+
+def environment_fingerprint(generator: ResumeGenerator, settings: dict[str, Any]) -> str:
+    """Hash everything besides the resume that shapes the outputs.
+
+    Covers the tool and browser versions, the package sources, ``settings``
+    (the generator arguments plus any output options such as ``write_html``)
+    and every template, stylesheet, photo and font the generator reads.
+    ``today`` is left out; open-ended durations are tracked per entry instead,
+    as are the pictures that individual resumes point to.
+    """
+    digest = hashlib.sha256(_tool_version().encode())
+    stable = {key: str(value) for key, value in settings.items() if key != "today"}
+    digest.update(json.dumps(stable, sort_keys=True).encode())
+    sources = sorted(_PACKAGE_DIR.glob("*.py"))
+    for path in [*sources, *generator.dependency_paths()]:
+        digest.update(str(path).encode())
+        digest.update(file_hash(path).encode() if path.is_file() else b"missing")
+    return digest.hexdigest()
+
+
+def open_ended_starts(resumes: Iterable[Resume]) -> list[date]:
+    """Return the start dates of entries whose rendered duration depends on today."""
+    starts = []
+    for resume in resumes:
+        for entry in (*(resume.work or ()), *(resume.education or ()), *(resume.volunteer or ())):
+            if entry.start is not None and entry.end is None:
+                starts.append(entry.start)
+    return starts
+
+
+class BuildManifest:
+    """What each input file of an output directory was last rendered from.
+
+    An entry records the input file hash, the environment fingerprint, the
+    hashes of the local pictures its resumes embed, the start dates of
+    open-ended entries with the durations they rendered as, and the output
+    paths (relative to the output directory). The manifest is rewritten
+    atomically by ``save``.
+    """
+
+    def __init__(self, output_dir: Path) -> None:
+        self.output_dir = Path(output_dir)
+        self.path = self.output_dir / MANIFEST_NAME
+        self.entries: dict[str, dict[str, Any]] = {}
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (FileNotFoundError, json.JSONDecodeError):
+            return
+        if data.get("version") == _MANIFEST_VERSION:
+            self.entries = data.get("entries", {})
+
+    def _relative(self, path: Optional[Path]) -> Optional[str]:
+        if path is None:
+            return None
+        try:
+            return str(Path(path).relative_to(self.output_dir))
+        except ValueError:
+            return str(path)
+
+    def _resolve(self, value: str) -> Path:
+        return self.output_dir / value
+
+    def lookup(
+        self,
+        input_path: Path,
+        input_hash: str,
+        environment: str,
+        today: date,
+    ) -> Optional[Outputs]:
+        """Return the previous outputs for ``input_path`` if they are still current."""
+        entry = self.entries.get(str(Path(input_path).resolve()))
+        if not entry or entry["input"] != input_hash or entry["environment"] != environment:
+            return None
+        durations = [
+            format_years(date.fromisoformat(start), today) for start in entry["open_starts"]
+        ]
+        if durations != entry["durations"]:
+            return None
+        for picture, picture_hash in entry["pictures"].items():
+            path = Path(picture)
+            if not path.is_file() or file_hash(path) != picture_hash:
+                return None
+        outputs: Outputs = [
+            (None if html is None else self._resolve(html), self._resolve(pdf))
+            for html, pdf in entry["outputs"]
+        ]
+        for html_path, pdf_path in outputs:
+            if not pdf_path.exists() or (html_path is not None and not html_path.exists()):
+                return None
+        return outputs
+
+    def record(
+        self,
+        input_path: Path,
+        input_hash: str,
+        environment: str,
+        today: date,
+        open_starts: list[date],
+        outputs: Outputs,
+        pictures: Iterable[Path] = (),
+    ) -> None:
+        self.entries[str(Path(input_path).resolve())] = {
+            "input": input_hash,
+            "environment": environment,
+            "pictures": {str(Path(path).resolve()): file_hash(path) for path in pictures},
+            "open_starts": [start.isoformat() for start in open_starts],
+            "durations": [format_years(start, today) for start in open_starts],
+            "outputs": [[self._relative(html), self._relative(pdf)] for html, pdf in outputs],
+        }
+
+    def save(self) -> None:
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        staging = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        payload = {"version": _MANIFEST_VERSION, "entries": self.entries}
+        staging.write_text(json.dumps(payload, indent=2, sort_keys=True), encoding="utf-8")
+        os.replace(staging, self.path)
@@ -0,0 +1,65 @@
+"""Memoized Markdown rendering exposed to templates as the ``markdown`` filter."""
+from __future__ import annotations
+
+import textwrap
+import threading
+from collections import OrderedDict
+from typing import Any, Optional, Sequence
+
+import markdown
+from jinja_markdown import EXTENSIONS
+from markupsafe import Markup, escape
+
+from .cache import CacheStats
+
+DEFAULT_MARKDOWN_CACHE_SIZE = 1024
+
+
+class MarkdownCache:
+    """Bounded LRU cache of Markdown-to-HTML conversions.
+
+    Entries are keyed by the source text; the extension list is fixed per
+    instance, so caches with different settings never share results. The
+    converter is not thread-safe, so conversions are serialized.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = DEFAULT_MARKDOWN_CACHE_SIZE,
+        extensions: Optional[Sequence[str]] = None,
+    ) -> None:
+        self.maxsize = maxsize
+        self.extensions = tuple(EXTENSIONS if extensions is None else extensions)
+        self.stats = CacheStats()
+        self._entries: OrderedDict[str, str] = OrderedDict()
+        self._markdowner = markdown.Markdown(extensions=list(self.extensions))
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def convert(self, text: str) -> str:
+        """Return the HTML for Markdown ``text``, converting it only on a miss."""
+        with self._lock:
+            html = self._entries.get(text)
+            if html is not None:
+                self._entries.move_to_end(text)
+                self.stats.hits += 1
+                return html
+            self.stats.misses += 1
+            html = self._markdowner.reset().convert(text)
+            self._entries[text] = html
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+            return html
+
+    def filter(self, value: Any) -> Markup:
+        """Jinja filter matching ``{% markdown %}``: escape, dedent, then convert."""
+        if not value:
+            return Markup("")
+        source = textwrap.dedent(str(escape(value)).strip("\n"))
+        return Markup(self.convert(source))
+
+
+# Shared by every generator in the process, so batches reuse conversions.
+markdown_cache = MarkdownCache()
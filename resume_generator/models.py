@@ -1,9 +1,72 @@
 """Pydantic models for resume schema."""
+from datetime import date, datetime
+from functools import lru_cache
 from typing import List, Optional
 
 from pydantic import BaseModel
 
 
+def parse_date(value: Optional[str]) -> Optional[date]:
+    """Best-effort parser for ISO-like date strings."""
+    if not value:
+        return None
+    text = str(value).strip()
+    for fmt in ("%Y-%m-%d", "%Y-%m", "%Y"):
+        try:
+            return datetime.strptime(text, fmt).date()
+        except ValueError:
+            continue
+    try:
+        return datetime.fromisoformat(text).date()
+    except ValueError:
+        return None
+
+
+def format_years(start: date, end: date) -> str:
+    """Replicate React's rounded duration helper."""
+    rounded = round((end - start).days / 365 * 2) / 2
+    return f"{rounded:.1f}"
+
+
+@lru_cache(maxsize=4096)
+def _date_span(
+    start_text: Optional[str], end_text: Optional[str]
+) -> tuple[Optional[date], Optional[date], Optional[str]]:
+    """Parse a date range and, when it is closed, its rounded length in years."""
+    start, end = parse_date(start_text), parse_date(end_text)
+    return start, end, format_years(start, end) if start and end else None
+
+
+class DateRange(BaseModel):
+    """Base for entries with ``startDate``/``endDate`` strings.
+
+    The dates are derived from the current field values on each access, so
+    assignment and ``model_copy(update=...)`` never leave them stale; a cache
+    keyed by the strings keeps repeated renders from parsing them again. Open
+    ranges are measured against the ``today`` passed to ``duration``.
+    """
+
+    def _span(self) -> tuple[Optional[date], Optional[date], Optional[str]]:
+        return _date_span(getattr(self, "startDate", None), getattr(self, "endDate", None))
+
+    @property
+    def start(self) -> Optional[date]:
+        return self._span()[0]
+
+    @property
+    def end(self) -> Optional[date]:
+        return self._span()[1]
+
+    def duration(self, today: Optional[date] = None) -> Optional[str]:
+        """Return the rounded length in years, or ``None`` without a start date."""
+        start, _end, closed_duration = self._span()
+        if start is None:
+            return None
+        if closed_duration is not None:
+            return closed_duration
+        return format_years(start, today or date.today())
+
+
 class Location(BaseModel):
     """Location information."""
     address: Optional[str] = None
@@ -39,7 +102,7 @@ class AdditionalItem(BaseModel):
     tech: List[str]
 
 
-class Work(BaseModel):
+class Work(DateRange):
     """Work experience."""
     name: Optional[str] = None
     position: Optional[str] = None
@@ -51,7 +114,7 @@ class Work(BaseModel):
     additional: Optional[List[AdditionalItem]] = None
 
 
-class Volunteer(BaseModel):
+class Volunteer(DateRange):
     """Volunteer experience."""
     organization: Optional[str] = None
     position: Optional[str] = None
@@ -62,7 +125,7 @@ class Volunteer(BaseModel):
     highlights: Optional[List[str]] = None
 
 
-class Education(BaseModel):
+class Education(DateRange):
     """Education information."""
     institution: Optional[str] = None
     area: Optional[str] = None
@@ -2,58 +2,485 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import html
+import os
+import re
+from importlib import metadata
 from pathlib import Path
-from typing import Optional
+from typing import Any, AsyncIterable, AsyncIterator, Iterable, Iterator, Optional
 
-from playwright.async_api import async_playwright
+from .cache import resolve_cache_dir
 
 _FONT_READY_JS = (
     "(async () => { if (document.fonts && document.fonts.ready) { "
     "await document.fonts.ready; } })()"
 )
+_LAUNCH_ARGS = ["--disable-web-security"]
 
+# Templates signal readiness by setting ``data-render-ready="true"`` on the root
+# element once fonts and images have decoded.
+READY_MARKER = "renderReady"
+_READY_JS = f"document.documentElement.dataset.{READY_MARKER} === 'true'"
+# The assignment that flips the marker. Autoescaped resume text cannot contain
+# it, since its quotes would be rendered as entities.
+_READY_SCRIPT_RE = re.compile(
+    rf"""dataset\.{READY_MARKER}\s*=\s*["']true["']"""
+    r"""|setAttribute\(\s*["']data-render-ready["']\s*,\s*["']true["']\s*\)"""
+)
+DEFAULT_READY_TIMEOUT_MS = 15_000
 
-async def html_to_pdf(
-    html_content: str,
-    output_path: Path,
-    base_url: Optional[str] = None,
-) -> None:
-    """Render the given HTML into a PDF file using Playwright."""
-    output_path = Path(output_path)
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-
-    async with async_playwright() as playwright:
-        browser = await playwright.chromium.launch(args=["--disable-web-security"])
-        context = await browser.new_context(bypass_csp=True)
+_PDF_FORMAT = "A4"
+_PRINT_BACKGROUND = True
+DEFAULT_PDF_CACHE_MAX_BYTES = 512 * 1024 * 1024
+
+_NO_JOB = object()
+
+
+class RenderTimeoutError(TimeoutError):
+    """Raised when a document does not signal readiness within the timeout."""
+
+
+def async_playwright() -> Any:
+    """Return Playwright's async context manager, importing Playwright on first use.
+
+    Keeping the import here lets the CLI hand work to the render daemon
+    without paying for Playwright's start-up.
+    """
+    from playwright.async_api import async_playwright as start_playwright
+
+    return start_playwright()
+
+
+def engine_version() -> str:
+    """Identify the browser build that prints PDFs, without launching it.
+
+    Each Playwright release pins an exact Chromium build, so the Playwright
+    version stands in for the browser's.
+    """
+    try:
+        return f"playwright-{metadata.version('playwright')}"
+    except metadata.PackageNotFoundError:
+        return "playwright-unknown"
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    # A fresh inode per write, so outputs and cache entries never share one.
+    staging = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    staging.write_bytes(data)
+    os.replace(staging, path)
+
+
+def signals_ready(html_content: str) -> bool:
+    """Return whether ``html_content`` carries a script that sets the ready marker."""
+    return _READY_SCRIPT_RE.search(html_content) is not None
+
+
+class PdfCache:
+    """Content-addressed on-disk store of rendered PDFs with LRU eviction.
+
+    Entries are keyed by a hash of the final HTML, the PDF options and the
+    browser build. Hits touch the entry's mtime; once the store grows beyond
+    ``max_bytes`` the least recently used entries are removed. Worker
+    processes share the directory and evict independently, so any entry may
+    vanish between listing and use.
+    """
+
+    def __init__(
+        self,
+        directory: Optional[Path] = None,
+        max_bytes: int = DEFAULT_PDF_CACHE_MAX_BYTES,
+    ) -> None:
+        self.directory = Path(directory) if directory else resolve_cache_dir("pdf")
+        self.max_bytes = max_bytes
+        self._size: Optional[int] = None
+
+    @staticmethod
+    def key(html_content: str) -> str:
+        digest = hashlib.sha256()
+        digest.update(f"{_PDF_FORMAT}|{_PRINT_BACKGROUND}|{engine_version()}\n".encode())
+        digest.update(html_content.encode("utf-8"))
+        return digest.hexdigest()
+
+    def _entry(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.pdf"
+
+    def get(self, key: str, output_path: Optional[Path] = None) -> Optional[bytes]:
+        """Return cached PDF bytes, copying them to ``output_path``."""
+        entry = self._entry(key)
+        try:
+            data = entry.read_bytes()
+        except FileNotFoundError:
+            return None
+        try:
+            os.utime(entry)
+        except FileNotFoundError:
+            pass  # Evicted by another process since the read; the bytes are still good.
+        if output_path is not None:
+            _write_atomic(output_path, data)
+        return data
+
+    def put(self, key: str, data: bytes) -> None:
+        """Store PDF bytes under ``key`` and evict old entries if over budget."""
+        entry = self._entry(key)
+        entry.parent.mkdir(parents=True, exist_ok=True)
+        _write_atomic(entry, data)
+        if self._size is None:
+            self._size = sum(entry_size for _, entry_size, _ in self._entries())
+        else:
+            self._size += len(data)
+        if self._size > self.max_bytes:
+            self._evict()
+
+    def _entries(self) -> list[tuple[float, int, Path]]:
+        """Return ``(mtime, size, path)`` of every entry still present."""
+        entries = []
+        for path in self.directory.glob("*/*.pdf"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def _evict(self) -> None:
+        entries = sorted(self._entries())
+        size = sum(entry_size for _, entry_size, _ in entries)
+        for _, entry_size, path in entries:
+            if size <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            size -= entry_size
+        self._size = size
+
+
+class PdfRenderer:
+    """Render any number of HTML documents through a single Chromium instance.
+
+    The browser is launched on the first render that needs it and pages are
+    kept warm between renders, so batch conversions only pay the browser
+    start-up cost a single time. At most ``max_pages`` documents are rendered
+    at once; further ``render`` calls wait for a page to be released. With a
+    ``cache``, documents rendered before are served from it without touching
+    the browser.
+
+    Documents with a script that sets the ``READY_MARKER`` (see
+    ``signals_ready``) are printed as soon as they flag themselves ready, or
+    fail with ``RenderTimeoutError`` after ``ready_timeout_ms``. Other
+    documents fall back to waiting for network idle and ``document.fonts.ready``.
+    Use it as an async context manager to guarantee a clean shutdown::
+
+        async with PdfRenderer(max_pages=4) as renderer:
+            await renderer.render(html_content, Path("resume.pdf"))
+    """
+
+    def __init__(
+        self,
+        max_pages: int = 1,
+        ready_timeout_ms: float = DEFAULT_READY_TIMEOUT_MS,
+        cache: Optional[PdfCache] = None,
+    ) -> None:
+        if max_pages < 1:
+            raise ValueError(f"max_pages must be at least 1, got {max_pages}")
+        self.max_pages = max_pages
+        self.ready_timeout_ms = ready_timeout_ms
+        self.cache = cache
+        self._slots = asyncio.Semaphore(max_pages)
+        self._starting = asyncio.Lock()
+        self._manager: Any = None
+        self._browser: Any = None
+        self._contexts: list[Any] = []
+        self._idle: list[tuple[Any, Any]] = []
+
+    async def __aenter__(self) -> "PdfRenderer":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+    async def start(self) -> None:
+        """Start Playwright and launch Chromium if not already running."""
+        async with self._starting:
+            if self._browser is not None:
+                return
+            self._manager = async_playwright()
+            playwright = await self._manager.__aenter__()
+            self._browser = await playwright.chromium.launch(args=_LAUNCH_ARGS)
+
+    async def close(self) -> None:
+        """Close every pooled context, the browser and Playwright itself."""
+        self._idle.clear()
+        contexts, self._contexts = self._contexts, []
+        for context in contexts:
+            await context.close()
+        if self._browser is not None:
+            await self._browser.close()
+            self._browser = None
+        if self._manager is not None:
+            await self._manager.__aexit__(None, None, None)
+            self._manager = None
+
+    async def _acquire(self) -> tuple[Any, Any]:
+        if self._idle:
+            return self._idle.pop()
+        await self.start()
+        context = await self._browser.new_context(bypass_csp=True)
+        self._contexts.append(context)
         page = await context.new_page()
+        return context, page
 
+    @staticmethod
+    async def _load(page: Any, html_content: str, base_url: Optional[str], wait_until: str) -> None:
         if base_url:
-            await page.goto(base_url, wait_until="networkidle")
+            await page.goto(base_url, wait_until=wait_until)
         else:
-            await page.set_content(html_content, wait_until="networkidle")
+            await page.set_content(html_content, wait_until=wait_until)
 
-        try:
-            await page.wait_for_load_state("networkidle")
-            await page.evaluate(_FONT_READY_JS)
-        except Exception:
-            pass
+    @staticmethod
+    async def _wait_until_ready(page: Any, output_path: Optional[Path], timeout_ms: float) -> None:
+        from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 
-        await page.pdf(path=str(output_path), format="A4", print_background=True)
+        try:
+            await page.wait_for_function(_READY_JS, timeout=timeout_ms)
+        except PlaywrightTimeoutError as exc:
+            target = f" for {output_path}" if output_path else ""
+            raise RenderTimeoutError(
+                f"Document{target} did not signal readiness within {timeout_ms} ms"
+            ) from exc
 
+    async def _discard(self, context: Any) -> None:
+        if context in self._contexts:
+            self._contexts.remove(context)
         await context.close()
-        await browser.close()
 
+    async def render(
+        self,
+        html_content: str,
+        output_path: Optional[Path] = None,
+        base_url: Optional[str] = None,
+        use_cache: bool = True,
+        ready_timeout_ms: Optional[float] = None,
+    ) -> bytes:
+        """Render HTML using a pooled page and return the PDF bytes.
 
-def render_pdf_from_html_file(html_file: Path, output_file: Optional[Path] = None) -> Path:
-    """Convert an HTML file to PDF using the async Playwright renderer."""
-    html_path = Path(html_file)
+        The document is loaded from ``base_url`` when given, otherwise
+        ``html_content`` is handed to the page directly. When ``output_path`` is
+        set the PDF is also written there. ``use_cache=False`` bypasses the
+        renderer's cache for this document. Documents loaded from ``base_url``
+        are never cached, since the assets they link to are not part of the key.
+        ``ready_timeout_ms`` overrides the renderer's timeout for this document.
+        """
+        if output_path is not None:
+            output_path = Path(output_path)
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+
+        cache = self.cache if use_cache and not base_url else None
+        key = cache.key(html_content) if cache else None
+        if cache and key:
+            cached = cache.get(key, output_path)
+            if cached is not None:
+                return cached
+
+        async with self._slots:
+            pdf_bytes = await self._render_on_page(
+                html_content,
+                output_path,
+                base_url,
+                self.ready_timeout_ms if ready_timeout_ms is None else ready_timeout_ms,
+            )
+        if cache and key:
+            cache.put(key, pdf_bytes)
+        return pdf_bytes
+
+    async def _render_on_page(
+        self,
+        html_content: str,
+        output_path: Optional[Path],
+        base_url: Optional[str],
+        ready_timeout_ms: float,
+    ) -> bytes:
+        context, page = await self._acquire()
+        try:
+            if signals_ready(html_content):
+                await self._load(page, html_content, base_url, "load")
+                await self._wait_until_ready(page, output_path, ready_timeout_ms)
+            else:
+                await self._load(page, html_content, base_url, "networkidle")
+                await page.evaluate(_FONT_READY_JS)
+
+            pdf_bytes = await page.pdf(format=_PDF_FORMAT, print_background=_PRINT_BACKGROUND)
+        except BaseException:
+            # A page that failed mid-render is not trusted for reuse.
+            await self._discard(context)
+            raise
+        self._idle.append((context, page))
+        if output_path is not None:
+            _write_atomic(output_path, pdf_bytes)
+        return pdf_bytes
+
+
+def _default_cache(use_cache: bool) -> Optional[PdfCache]:
+    return PdfCache() if use_cache else None
+
+
+async def html_to_pdf(
+    html_content: str,
+    output_path: Optional[Path] = None,
+    base_url: Optional[str] = None,
+    ready_timeout_ms: float = DEFAULT_READY_TIMEOUT_MS,
+    use_cache: bool = True,
+) -> bytes:
+    """Render the given HTML into PDF bytes, optionally writing ``output_path``."""
+    renderer = PdfRenderer(ready_timeout_ms=ready_timeout_ms, cache=_default_cache(use_cache))
+    async with renderer:
+        return await renderer.render(html_content, output_path, base_url=base_url)
+
+
+def render_pdf_from_html(
+    html_content: str,
+    output_file: Optional[Path] = None,
+    ready_timeout_ms: float = DEFAULT_READY_TIMEOUT_MS,
+    use_cache: bool = True,
+) -> bytes:
+    """Convert an in-memory HTML document to PDF without touching the disk.
+
+    The rendered PDF is returned as bytes and also written to ``output_file``
+    when one is given.
+    """
+    return asyncio.run(
+        html_to_pdf(
+            html_content,
+            output_file,
+            ready_timeout_ms=ready_timeout_ms,
+            use_cache=use_cache,
+        )
+    )
+
+
+def _read_html_file(html_path: Path) -> tuple[str, str]:
     if not html_path.exists():
-        raise FileNotFoundError(f"HTML file not found: {html_file}")
+        raise FileNotFoundError(f"HTML file not found: {html_path}")
+    html_content = html.unescape(html_path.read_text(encoding="utf-8"))
+    return html_content, html_path.resolve().as_uri()
+
 
+def render_pdf_from_html_file(
+    html_file: Path,
+    output_file: Optional[Path] = None,
+    ready_timeout_ms: float = DEFAULT_READY_TIMEOUT_MS,
+    use_cache: bool = True,
+) -> Path:
+    """Convert an HTML file to PDF using the async Playwright renderer."""
+    html_path = Path(html_file)
     target_path = Path(output_file) if output_file else html_path.with_suffix(".pdf")
-    html_content = html.unescape(html_path.read_text(encoding="utf-8"))
-    base_uri = html_path.resolve().as_uri()
+    html_content, base_uri = _read_html_file(html_path)
 
-    asyncio.run(html_to_pdf(html_content, target_path, base_url=base_uri))
+    asyncio.run(
+        html_to_pdf(
+            html_content,
+            target_path,
+            base_url=base_uri,
+            ready_timeout_ms=ready_timeout_ms,
+            use_cache=use_cache,
+        )
+    )
     return target_path
+
+
+async def _job_stream(jobs: Iterable[Any] | AsyncIterable[Any]) -> AsyncIterator[Any]:
+    if isinstance(jobs, AsyncIterable):
+        async for job in jobs:
+            yield job
+        return
+    # Advance plain iterables on a worker thread: producing a job may read
+    # files or render templates, which must not stall the pages printing.
+    iterator = iter(jobs)
+    while (job := await asyncio.to_thread(next, iterator, _NO_JOB)) is not _NO_JOB:
+        yield job
+
+
+async def _render_jobs(
+    jobs: AsyncIterable[tuple[str, Path, Optional[str]]],
+    concurrency: int,
+    ready_timeout_ms: float,
+    use_cache: bool,
+) -> list[Path]:
+    slots = asyncio.Semaphore(concurrency)
+
+    async def render_one(
+        renderer: PdfRenderer,
+        html_content: str,
+        pdf_path: Path,
+        base_url: Optional[str],
+    ) -> Path:
+        try:
+            await renderer.render(html_content, pdf_path, base_url=base_url)
+        finally:
+            slots.release()
+        return pdf_path
+
+    renderer = PdfRenderer(
+        max_pages=concurrency,
+        ready_timeout_ms=ready_timeout_ms,
+        cache=_default_cache(use_cache),
+    )
+    async with renderer:
+        async with asyncio.TaskGroup() as group:
+            tasks = []
+            # Jobs are pulled lazily: the next document is prepared while the
+            # current ones print, then waits for a free slot.
+            async for html_content, pdf_path, base_url in jobs:
+                tasks.append(
+                    group.create_task(render_one(renderer, html_content, pdf_path, base_url))
+                )
+                await slots.acquire()
+    return [task.result() for task in tasks]
+
+
+def _check_concurrency(concurrency: int) -> None:
+    if concurrency < 1:
+        raise ValueError(f"concurrency must be at least 1, got {concurrency}")
+
+
+def render_pdfs_from_html(
+    jobs: Iterable[tuple[str, Path]] | AsyncIterable[tuple[str, Path]],
+    concurrency: int = 1,
+    ready_timeout_ms: float = DEFAULT_READY_TIMEOUT_MS,
+    use_cache: bool = True,
+) -> list[Path]:
+    """Convert many ``(html_content, pdf_file)`` pairs sharing one browser instance.
+
+    ``jobs`` may be a lazy iterable; each document is only requested once a
+    page is available. A plain iterable is advanced on a worker thread and an
+    async iterable, such as a ``Pipeline``, is awaited, so the browser keeps
+    printing while the next document is prepared. Up to ``concurrency``
+    documents are rendered at once.
+    """
+    _check_concurrency(concurrency)
+
+    async def triples() -> AsyncIterator[tuple[str, Path, Optional[str]]]:
+        async for html_content, pdf_path in _job_stream(jobs):
+            yield html_content, Path(pdf_path), None
+
+    return asyncio.run(_render_jobs(triples(), concurrency, ready_timeout_ms, use_cache))
+
+
+def render_pdfs_from_html_files(
+    jobs: Iterable[tuple[Path, Path]],
+    concurrency: int = 1,
+    ready_timeout_ms: float = DEFAULT_READY_TIMEOUT_MS,
+    use_cache: bool = True,
+) -> list[Path]:
+    """Convert many ``(html_file, pdf_file)`` pairs sharing one browser instance.
+
+    Up to ``concurrency`` documents are rendered at once, each on its own page.
+    """
+    _check_concurrency(concurrency)
+
+    def triples() -> Iterator[tuple[str, Path, Optional[str]]]:
+        for html_path, pdf_path in jobs:
+            html_content, base_uri = _read_html_file(Path(html_path))
+            yield html_content, Path(pdf_path), base_uri
+
+    stream = _job_stream(triples())
+    return asyncio.run(_render_jobs(stream, concurrency, ready_timeout_ms, use_cache))
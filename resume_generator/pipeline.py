@@ -0,0 +1,172 @@
+"""Threaded stages joined by bounded queues, so batch steps overlap instead of alternating."""
+from __future__ import annotations
+
+import asyncio
+import queue
+import threading
+import time
+from collections.abc import AsyncIterator, Callable, Iterable, Iterator
+from dataclasses import dataclass
+from typing import Any, Optional
+
+DEFAULT_QUEUE_SIZE = 8
+
+_DONE = object()
+
+
+@dataclass
+class StageStats:
+    """Counters for one stage and the queue it feeds.
+
+    ``busy_seconds`` excludes time spent waiting for input or for room in the
+    output queue, so the stage with the most busy time is the bottleneck.
+    ``peak_depth`` is the fullest the stage's output queue got.
+    """
+
+    name: str
+    capacity: int
+    processed: int = 0
+    busy_seconds: float = 0.0
+    peak_depth: int = 0
+
+    def merge(self, other: StageStats) -> None:
+        """Fold in the counters of the same stage run elsewhere (another worker)."""
+        self.processed += other.processed
+        self.busy_seconds += other.busy_seconds
+        self.peak_depth = max(self.peak_depth, other.peak_depth)
+
+
+class Pipeline:
+    """Run a chain of stages on threads joined by bounded queues.
+
+    The first stage pulls items from ``source``; each stage added with ``stage``
+    maps one item to zero or more items for the next. A full queue blocks its
+    producer, so memory stays bounded and the slowest stage sets the pace.
+    Iterating the pipeline, synchronously or with ``async for``, starts the
+    threads and yields the last stage's output. The first error raised by a
+    stage stops every stage and is re-raised to the consumer.
+    """
+
+    def __init__(
+        self,
+        source: Iterable[Any],
+        name: str = "source",
+        maxsize: int = DEFAULT_QUEUE_SIZE,
+    ) -> None:
+        if maxsize < 1:
+            raise ValueError(f"queue size must be at least 1, got {maxsize}")
+        self.maxsize = maxsize
+        self._source = source
+        self._stages: list[tuple[StageStats, Optional[Callable[[Any], Iterable[Any]]]]] = [
+            (StageStats(name, maxsize), None)
+        ]
+        self._queues: list[queue.Queue[Any]] = []
+        self._threads: list[threading.Thread] = []
+        self._error: Optional[BaseException] = None
+
+    def stage(self, name: str, func: Callable[[Any], Iterable[Any]]) -> Pipeline:
+        """Append a stage that turns each item into the items ``func`` returns."""
+        if self._threads:
+            raise RuntimeError("Cannot add stages to a running pipeline")
+        self._stages.append((StageStats(name, self.maxsize), func))
+        return self
+
+    @property
+    def stats(self) -> list[StageStats]:
+        return [stats for stats, _func in self._stages]
+
+    def depths(self) -> dict[str, int]:
+        """Return how many items wait in each stage's output queue right now."""
+        return {
+            stats.name: pending.qsize()
+            for (stats, _func), pending in zip(self._stages, self._queues)
+        }
+
+    def _fail(self, exc: BaseException) -> None:
+        if self._error is None:
+            self._error = exc
+        for pending in self._queues:
+            pending.shutdown(immediate=True)
+
+    def _run(self, index: int) -> None:
+        stats, func = self._stages[index]
+        outbox = self._queues[index]
+        waited = 0.0
+        started = time.perf_counter()
+
+        def inputs() -> Iterator[Any]:
+            nonlocal waited
+            inbox = self._queues[index - 1]
+            while True:
+                mark = time.perf_counter()
+                item = inbox.get()
+                waited += time.perf_counter() - mark
+                if item is _DONE:
+                    return
+                yield item
+
+        try:
+            if func is None:
+                outputs: Iterable[Any] = self._source
+            else:
+                outputs = (output for item in inputs() for output in func(item))
+            for output in outputs:
+                mark = time.perf_counter()
+                outbox.put(output)
+                waited += time.perf_counter() - mark
+                stats.processed += 1
+                stats.peak_depth = max(stats.peak_depth, outbox.qsize())
+            outbox.put(_DONE)
+        except queue.ShutDown:
+            pass
+        except BaseException as exc:
+            self._fail(exc)
+        finally:
+            stats.busy_seconds = time.perf_counter() - started - waited
+
+    def start(self) -> None:
+        if self._threads:
+            raise RuntimeError("Pipeline already started")
+        self._queues = [queue.Queue(self.maxsize) for _ in self._stages]
+        for index, (stats, _func) in enumerate(self._stages):
+            thread = threading.Thread(
+                target=self._run,
+                args=(index,),
+                name=f"pipeline-{stats.name}",
+                daemon=True,
+            )
+            self._threads.append(thread)
+            thread.start()
+
+    def close(self) -> None:
+        """Stop every stage, discarding queued items, and wait for the threads."""
+        for pending in self._queues:
+            pending.shutdown(immediate=True)
+        for thread in self._threads:
+            thread.join()
+
+    def _next(self) -> Any:
+        try:
+            return self._queues[-1].get()
+        except queue.ShutDown:
+            return _DONE
+
+    def __iter__(self) -> Iterator[Any]:
+        self.start()
+        try:
+            while (item := self._next()) is not _DONE:
+                yield item
+        finally:
+            self.close()
+        if self._error is not None:
+            raise self._error
+
+    async def __aiter__(self) -> AsyncIterator[Any]:
+        self.start()
+        try:
+            while (item := await asyncio.to_thread(self._next)) is not _DONE:
+                yield item
+        finally:
+            await asyncio.to_thread(self.close)
+        if self._error is not None:
+            raise self._error
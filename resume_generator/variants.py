@@ -0,0 +1,78 @@
+"""Render one resume in several variants through shared generators."""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Optional
+
+from .generator import PATH_SETTINGS, ResumeGenerator, coerce_settings
+from .loader import load_resume_data
+from .models import Resume
+
+
+@dataclass(frozen=True)
+class Variant:
+    """A named output: ``ResumeGenerator`` settings plus resume overrides."""
+
+    name: str
+    settings: dict[str, Any] = field(default_factory=dict)
+    cv_footer: Optional[str] = None
+
+    def apply(self, resume: Resume) -> Resume:
+        """Return ``resume`` with this variant's overrides, without re-validating it."""
+        if self.cv_footer is None:
+            return resume
+        return resume.model_copy(update={"cvFooter": self.cv_footer})
+
+
+def load_variants(path: Path) -> list[Variant]:
+    """Read the ``variants`` mapping of a JSON or YAML config file.
+
+    Each entry maps a variant name to ``ResumeGenerator`` keyword arguments and
+    an optional ``cv_footer``. Settings are converted to their parameter types
+    by ``coerce_settings``, and relative paths are resolved against the config
+    file's directory.
+    """
+    data = load_resume_data(path)
+    entries = data.get("variants") if isinstance(data, dict) else None
+    if not isinstance(entries, dict) or not entries:
+        raise ValueError(f"Variant config must define a non-empty 'variants' mapping: {path}")
+
+    variants = []
+    for name, options in entries.items():
+        if options is not None and not isinstance(options, dict):
+            raise ValueError(f"Variant {name!r} must map setting names to values: {path}")
+        settings = dict(options or {})
+        cv_footer = settings.pop("cv_footer", None)
+        try:
+            settings = coerce_settings(settings)
+        except ValueError as exc:
+            raise ValueError(f"Variant {name!r} in {path}: {exc}") from None
+        for key in PATH_SETTINGS & settings.keys():
+            if settings[key]:
+                settings[key] = (path.parent / settings[key]).resolve()
+        variants.append(Variant(str(name), settings, cv_footer))
+    return variants
+
+
+class VariantRenderer:
+    """Render variants of a validated resume, one generator per distinct settings.
+
+    Variants that only differ in resume overrides share a generator, and with
+    it the Jinja environment and asset caches.
+    """
+
+    def __init__(self, base_settings: Optional[dict[str, Any]] = None) -> None:
+        self.base_settings = dict(base_settings or {})
+        self._generators: dict[tuple[Any, ...], ResumeGenerator] = {}
+
+    def generator(self, variant: Variant) -> ResumeGenerator:
+        settings = {**self.base_settings, **variant.settings}
+        key = tuple(sorted(settings.items()))
+        generator = self._generators.get(key)
+        if generator is None:
+            generator = self._generators[key] = ResumeGenerator(**settings)
+        return generator
+
+    def generate_html(self, resume: Resume, variant: Variant) -> str:
+        return self.generator(variant).generate_html(variant.apply(resume))
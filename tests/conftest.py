@@ -1,8 +1,143 @@
 """Pytest configuration to ensure project imports work."""
 from __future__ import annotations
 
+import asyncio
 import sys
 from pathlib import Path
+from typing import Any, Callable
+
+import pytest
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(PROJECT_ROOT))
+
+from resume_generator import pdf as pdf_module  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache_dir(
+    tmp_path_factory: pytest.TempPathFactory, monkeypatch: pytest.MonkeyPatch
+) -> Path:
+    """Keep on-disk caches out of the user's home directory during tests."""
+    cache_dir = tmp_path_factory.mktemp("cache")
+    monkeypatch.setenv("RESUME_CACHE_DIR", str(cache_dir))
+    return cache_dir
+
+
+class FakePage:
+    """Playwright page stand-in that records every call into ``recorder``.
+
+    ``pdf_delay`` keeps ``pdf`` busy for a while so concurrency can be
+    observed, and ``ready=False`` makes ``wait_for_function`` time out. The
+    printed bytes are ``recorder["pdf_bytes"]``.
+    """
+
+    def __init__(self, recorder: dict[str, Any], pdf_delay: float = 0.0, ready: bool = True):
+        self.recorder = recorder
+        self.pdf_delay = pdf_delay
+        self.ready = ready
+
+    async def goto(self, url: str, wait_until: str) -> None:
+        self.recorder["goto"] = (url, wait_until)
+
+    async def set_content(self, content: str, wait_until: str) -> None:
+        self.recorder["set_content"] = (content, wait_until)
+
+    async def wait_for_load_state(self, state: str) -> None:
+        self.recorder["load_state"] = state
+
+    async def evaluate(self, script: str) -> None:
+        self.recorder["evaluate_script"] = script
+
+    async def wait_for_function(self, expression: str, timeout: float) -> None:
+        self.recorder["wait_for_function"] = (expression, timeout)
+        if not self.ready:
+            raise PlaywrightTimeoutError("Timeout exceeded")
+
+    async def pdf(
+        self, format: str, print_background: bool, path: str | None = None
+    ) -> bytes:
+        self.recorder["active"] += 1
+        self.recorder["peak"] = max(self.recorder["peak"], self.recorder["active"])
+        if self.pdf_delay:
+            await asyncio.sleep(self.pdf_delay)
+        self.recorder["active"] -= 1
+        self.recorder["pdf_call"] = {
+            "path": Path(path) if path else None,
+            "format": format,
+            "print_background": print_background,
+        }
+        data = self.recorder["pdf_bytes"]
+        if path:
+            Path(path).write_bytes(data)
+        return data
+
+
+class FakeContext:
+    def __init__(self, recorder: dict[str, Any], page_options: dict[str, Any]) -> None:
+        self.recorder = recorder
+        self.page_options = page_options
+
+    async def new_page(self) -> FakePage:
+        return FakePage(self.recorder, **self.page_options)
+
+    async def close(self) -> None:
+        self.recorder["context_closed"] = True
+
+
+class FakeBrowser:
+    def __init__(self, recorder: dict[str, Any], page_options: dict[str, Any]) -> None:
+        self.recorder = recorder
+        self.page_options = page_options
+
+    async def new_context(self, bypass_csp: bool) -> FakeContext:
+        self.recorder["bypass_csp"] = bypass_csp
+        self.recorder["contexts"] += 1
+        return FakeContext(self.recorder, self.page_options)
+
+    async def close(self) -> None:
+        self.recorder["browser_closed"] = True
+
+
+class FakeChromium:
+    def __init__(self, recorder: dict[str, Any], page_options: dict[str, Any]) -> None:
+        self.recorder = recorder
+        self.page_options = page_options
+
+    async def launch(self, args: list[str]) -> FakeBrowser:
+        self.recorder["launch_args"] = args
+        self.recorder["launches"] += 1
+        return FakeBrowser(self.recorder, self.page_options)
+
+
+class FakePlaywright:
+    def __init__(self, recorder: dict[str, Any], page_options: dict[str, Any]) -> None:
+        self.recorder = recorder
+        self.chromium = FakeChromium(recorder, page_options)
+
+    async def __aenter__(self) -> FakePlaywright:
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        self.recorder["playwright_closed"] = True
+
+
+@pytest.fixture
+def fake_playwright(monkeypatch: pytest.MonkeyPatch) -> Callable[..., dict[str, Any]]:
+    """Replace Playwright with fakes; call with ``FakePage`` options, get the recorder."""
+
+    def install(**page_options: Any) -> dict[str, Any]:
+        recorder: dict[str, Any] = {
+            "launches": 0,
+            "contexts": 0,
+            "active": 0,
+            "peak": 0,
+            "pdf_bytes": b"stub-pdf",
+        }
+        monkeypatch.setattr(
+            pdf_module, "async_playwright", lambda: FakePlaywright(recorder, page_options)
+        )
+        return recorder
+
+    return install
@@ -1,12 +1,19 @@
 """Tests for CLI helpers and commands."""
 from __future__ import annotations
 
+import base64
 import shutil
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+from datetime import date
 from pathlib import Path
 
 import pytest
 
 import main
+from resume_generator.generator import ResumeGenerator
+from resume_generator.models import Resume
+from resume_generator.variants import Variant, VariantRenderer, load_variants
 
 
 def test_prepare_output_path_requires_force(tmp_path: Path) -> None:
@@ -28,7 +35,7 @@ def test_pdf_command_adds_timestamp_when_requested(
 
     outputs: list[Path] = []
 
-    def fake_render(html_path: Path, output_path: Path | None) -> Path:
+    def fake_render(html_path: Path, output_path: Path | None, **_options) -> Path:
         assert output_path is not None
         target = Path(output_path)
         target.write_text("pdf", encoding="utf-8")
@@ -84,17 +91,19 @@ def test_full_many_processes_directory(
     shutil.copy(data_dir / "resume.json", input_dir / "sample.json")
     shutil.copy(data_dir / "resume.yaml", input_dir / "sample.yaml")
 
-    def fake_generate_html(self, resume, output_path):
-        Path(output_path).write_text("<html></html>", encoding="utf-8")
+    def fake_generate_html(self, resume):
+        return "<html></html>"
 
-    monkeypatch.setattr(main.ResumeGenerator, "generate_html_file", fake_generate_html)
+    monkeypatch.setattr(ResumeGenerator, "generate_html", fake_generate_html)
 
-    def fake_render(html_path: Path, output_path: Path | None) -> Path:
-        assert output_path is not None
-        Path(output_path).write_text("pdf", encoding="utf-8")
-        return Path(output_path)
+    def fake_render_many(jobs, concurrency: int = 1, **_options) -> list[Path]:
+        rendered = []
+        for _html_content, pdf_path in jobs:
+            Path(pdf_path).write_text("pdf", encoding="utf-8")
+            rendered.append(Path(pdf_path))
+        return rendered
 
-    monkeypatch.setattr(main, "render_pdf_from_html_file", fake_render)
+    monkeypatch.setattr(main, "render_pdfs_from_html", fake_render_many)
 
     timestamps = iter([
         "2025-01-01-03-03",
@@ -132,4 +141,254 @@ def test_full_many_processes_directory(
 
 def test_cv_basename_removes_polish_characters() -> None:
     result = main._cv_basename("Artur Kuźmiński", fallback="fallback")
-    assert result == "Artur_Kuzminski_CV"
\ No newline at end of file
+    assert result == "Artur_Kuzminski_CV"
+
+
+def test_full_many_workers_merge_shards_in_input_order(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    input_dir = tmp_path / "input"
+    output_dir = tmp_path / "output"
+    input_dir.mkdir()
+
+    data_dir = Path("tests/data")
+    for stem in ("alpha", "bravo", "charlie"):
+        shutil.copy(data_dir / "resume.json", input_dir / f"{stem}.json")
+
+    def fake_generate_html(self, resume):
+        return "<html></html>"
+
+    def fake_render_many(jobs, concurrency: int = 1, **_options) -> list[Path]:
+        return [Path(pdf_path) for _html_content, pdf_path in jobs]
+
+    monkeypatch.setattr(ResumeGenerator, "generate_html", fake_generate_html)
+    monkeypatch.setattr(main, "render_pdfs_from_html", fake_render_many)
+    monkeypatch.setattr(main, "_dated_folder_name", lambda: "2025-01-01-03-03")
+    # Threads stand in for processes so the monkeypatched helpers stay in effect.
+    monkeypatch.setattr(main, "ProcessPoolExecutor", ThreadPoolExecutor)
+
+    main.full_many(main.FullManyOptions(input_dir=input_dir, output_dir=output_dir, workers=2))
+
+    listed = [
+        line.split("/")[0].strip(" -")
+        for line in capsys.readouterr().out.splitlines()[1:]
+    ]
+    assert listed == ["alpha", "bravo", "charlie"]
+
+
+def test_variants_render_every_variant_with_shared_generators(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    config = tmp_path / "variants.yaml"
+    config.write_text(
+        "variants:\n"
+        "  full: {}\n"
+        "  no-photo:\n"
+        "    show_photo: false\n"
+        "  short footer:\n"
+        "    cv_footer: Short footer.\n",
+        encoding="utf-8",
+    )
+    rendered: dict[str, str] = {}
+
+    def fake_render_many(jobs, concurrency: int = 1, **_options) -> list[Path]:
+        for html_content, pdf_path in jobs:
+            rendered[Path(pdf_path).name] = html_content
+        return [Path(name) for name in rendered]
+
+    monkeypatch.setattr(main, "render_pdfs_from_html", fake_render_many)
+    used: list[ResumeGenerator] = []
+    original_generator = VariantRenderer.generator
+
+    def recording_generator(self: VariantRenderer, variant: Variant) -> ResumeGenerator:
+        generator = original_generator(self, variant)
+        used.append(generator)
+        return generator
+
+    monkeypatch.setattr(VariantRenderer, "generator", recording_generator)
+
+    main.variants(
+        main.VariantsOptions(
+            input_file=Path("tests/data/resume.json"),
+            config=config,
+            output_dir=tmp_path / "out",
+        )
+    )
+
+    assert list(rendered) == [
+        "Sample_Person_CV_full.pdf",
+        "Sample_Person_CV_no_photo.pdf",
+        "Sample_Person_CV_short_footer.pdf",
+    ]
+    assert 'class="profile-pic"' in rendered["Sample_Person_CV_full.pdf"]
+    assert 'class="profile-pic"' not in rendered["Sample_Person_CV_no_photo.pdf"]
+    assert "Short footer." in rendered["Sample_Person_CV_short_footer.pdf"]
+    assert len(used) == 3
+    assert len({id(generator) for generator in used}) == 2
+    assert len(list((tmp_path / "out").glob("*.html"))) == 3
+
+
+def test_load_variants_coerces_and_validates_settings(tmp_path: Path) -> None:
+    config = tmp_path / "variants.json"
+    config.write_text(
+        '{"variants": {"pinned": {"today": "2025-01-01", "profile_photo": "me.jpg"}}}',
+        encoding="utf-8",
+    )
+
+    [variant] = load_variants(config)
+
+    assert variant.settings == {
+        "today": date(2025, 1, 1),
+        "profile_photo": (tmp_path / "me.jpg").resolve(),
+    }
+    html = VariantRenderer().generate_html(
+        Resume.model_validate({"basics": {"name": "Ada"}, "work": [{"startDate": "2020-01"}]}),
+        variant,
+    )
+    assert "(5.0 years)" in html
+
+    config.write_text('{"variants": {"odd": {"photo_dpi": [1, 2]}}}', encoding="utf-8")
+    with pytest.raises(ValueError, match="Variant 'odd'.*'photo_dpi'"):
+        load_variants(config)
+
+
+def test_full_many_renders_every_record_of_a_json_lines_file(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    input_dir = tmp_path / "input"
+    input_dir.mkdir()
+    (input_dir / "export.jsonl").write_text(
+        '{"basics": {"name": "Ada Lovelace"}}\n{"basics": {"name": "Grace Hopper"}}\n',
+        encoding="utf-8",
+    )
+    # A sibling file whose name matches a numbered stream folder must not clash.
+    (input_dir / "export-2.yaml").write_text("basics:\n  name: Grace Hopper\n", encoding="utf-8")
+
+    def fake_render_many(jobs, concurrency: int = 1, **_options) -> list[Path]:
+        return [Path(pdf_path) for _html_content, pdf_path in jobs]
+
+    monkeypatch.setattr(main, "render_pdfs_from_html", fake_render_many)
+    monkeypatch.setattr(main, "_dated_folder_name", lambda: "2025-01-01-03-03")
+
+    main.full_many(
+        main.FullManyOptions(
+            input_dir=input_dir, output_dir=tmp_path / "output", pipeline_stats=True
+        )
+    )
+
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[0].startswith("Processed 3 resume(s)")
+    assert "export-2/2025-01-01-03-03/Grace_Hopper_CV.pdf" in lines[1]
+    assert "export/2025-01-01-03-03/Ada_Lovelace_CV.pdf" in lines[2]
+    assert "export/2/2025-01-01-03-03/Grace_Hopper_CV.pdf" in lines[3]
+    assert lines[5].startswith("  load: 3 item(s)")
+    assert lines[6].startswith("  html: 3 item(s)")
+    assert lines[7] == "  pdf: 3 item(s)"
+
+
+def test_full_many_incremental_reuses_outputs_of_unchanged_files(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    input_dir = tmp_path / "input"
+    input_dir.mkdir()
+    shutil.copy(Path("tests/data/resume.json"), input_dir / "first.json")
+    shutil.copy(Path("tests/data/resume.yaml"), input_dir / "second.yaml")
+
+    rendered: list[Path] = []
+
+    def fake_render_many(jobs, concurrency: int = 1, **_options) -> list[Path]:
+        for _html_content, pdf_path in jobs:
+            Path(pdf_path).write_text("pdf", encoding="utf-8")
+            rendered.append(Path(pdf_path))
+        return rendered
+
+    monkeypatch.setattr(main, "render_pdfs_from_html", fake_render_many)
+    timestamps = iter(["2025-01-01-03-03", "2025-01-01-03-03", "2025-01-02-03-03"])
+    monkeypatch.setattr(main, "_dated_folder_name", lambda: next(timestamps))
+    options = main.FullManyOptions(
+        input_dir=input_dir, output_dir=tmp_path / "output", incremental=True
+    )
+
+    main.full_many(options)
+    assert len(rendered) == 2
+    capsys.readouterr()
+
+    main.full_many(options)
+    assert len(rendered) == 2
+    output = capsys.readouterr().out
+    assert "2 unchanged file(s)" in output
+    assert "first/2025-01-01-03-03/Sample_Person_CV.pdf" in output
+
+    (input_dir / "second.yaml").write_text(
+        "basics:\n  name: Grace Hopper\n", encoding="utf-8"
+    )
+    main.full_many(options)
+    assert [path.parent.parent.name for path in rendered] == ["first", "second", "second"]
+    assert rendered[-1].name == "Grace_Hopper_CV.pdf"
+
+
+def test_full_many_incremental_rerenders_when_output_options_change(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    input_dir = tmp_path / "input"
+    input_dir.mkdir()
+    shutil.copy(Path("tests/data/resume.json"), input_dir / "sample.json")
+    rendered: list[Path] = []
+
+    def fake_render_many(jobs, concurrency: int = 1, **_options) -> list[Path]:
+        for _html_content, pdf_path in jobs:
+            Path(pdf_path).write_text("pdf", encoding="utf-8")
+            rendered.append(Path(pdf_path))
+        return rendered
+
+    monkeypatch.setattr(main, "render_pdfs_from_html", fake_render_many)
+    monkeypatch.setattr(main, "_dated_folder_name", lambda: "2025-01-01-03-03")
+    options = main.FullManyOptions(
+        input_dir=input_dir,
+        output_dir=tmp_path / "output",
+        incremental=True,
+        write_html=False,
+        force=True,
+    )
+
+    main.full_many(options)
+    main.full_many(replace(options, write_html=True))
+
+    assert len(rendered) == 2
+    assert list((tmp_path / "output").glob("sample/*/*.html"))
+
+
+def test_full_many_incremental_rerenders_when_the_picture_changes(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    input_dir = tmp_path / "input"
+    input_dir.mkdir()
+    (input_dir / "sample.yaml").write_text(
+        "basics:\n  name: Sample Person\n  picture: me.png\n", encoding="utf-8"
+    )
+    (tmp_path / "me.png").write_bytes(b"first photo")
+    monkeypatch.chdir(tmp_path)
+    rendered: list[str] = []
+
+    def fake_render_many(jobs, concurrency: int = 1, **_options) -> list[Path]:
+        for html_content, pdf_path in jobs:
+            Path(pdf_path).write_text("pdf", encoding="utf-8")
+            rendered.append(html_content)
+        return []
+
+    monkeypatch.setattr(main, "render_pdfs_from_html", fake_render_many)
+    monkeypatch.setattr(main, "_dated_folder_name", lambda: "2025-01-01-03-03")
+    options = main.FullManyOptions(
+        input_dir=input_dir, output_dir=tmp_path / "output", incremental=True, force=True
+    )
+
+    main.full_many(options)
+    main.full_many(options)
+    assert len(rendered) == 1
+    assert "1 unchanged file(s)" in capsys.readouterr().out
+
+    (tmp_path / "me.png").write_bytes(b"second photo")
+    main.full_many(options)
+
+    assert len(rendered) == 2
+    assert base64.b64encode(b"second photo").decode("ascii") in rendered[-1]
@@ -0,0 +1,50 @@
+"""Tests for stylesheet minification and pruning."""
+from __future__ import annotations
+
+from resume_generator.css import document_tokens, minify_stylesheet, prune_stylesheet
+from resume_generator.generator import ResumeGenerator
+from resume_generator.models import Basics, Resume, Work
+
+
+def test_minify_stylesheet_keeps_strings_intact() -> None:
+    css = """
+    /* heading */
+    h1 ,  h2 {
+        font-family: "Josefin  Sans", sans-serif;
+        content: '/* not a comment */';
+    }
+    """
+
+    assert minify_stylesheet(css) == (
+        "h1,h2{font-family:\"Josefin  Sans\",sans-serif;content:'/* not a comment */'}"
+    )
+
+
+def test_prune_stylesheet_drops_unmatched_selectors() -> None:
+    css = """
+    :root { --gap: 4px; }
+    .job, .title h3 { margin: 0; }
+    .portfolio a:hover { color: red; }
+    @media print { .portfolio { display: none; } .title { color: black; } }
+    @page { margin: 0; }
+    """
+    tokens = document_tokens('<div class="title"><h3>Summary</h3></div>')
+
+    assert prune_stylesheet(css, tokens) == (
+        ":root{--gap:4px}.title h3{margin:0}"
+        "@media print{.title{color:black}}@page{margin:0}"
+    )
+
+
+def test_prune_css_keeps_only_rules_for_rendered_sections() -> None:
+    bare = Resume(basics=Basics(name="Sample Person"))
+    with_work = Resume(basics=Basics(name="Sample Person"), work=[Work(name="Acme")])
+    generator = ResumeGenerator(prune_css=True)
+
+    pruned = generator.generate_html(bare)
+
+    assert ".cv-footer{" in pruned
+    assert ".job{" not in pruned
+    assert "py-resume:stylesheet" not in pruned
+    assert len(pruned) < len(ResumeGenerator(minify_css=True).generate_html(bare))
+    assert ".job{" in generator.generate_html(with_work)
@@ -0,0 +1,59 @@
+"""Tests for the warm render daemon and its socket client."""
+from __future__ import annotations
+
+import asyncio
+import socket
+from pathlib import Path
+
+import pytest
+
+from resume_generator import daemon as daemon_module
+
+pytestmark = pytest.mark.skipif(
+    not daemon_module.daemon_supported(), reason="Unix domain sockets unavailable"
+)
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+
+
+def test_request_daemon_returns_none_without_server(tmp_path: Path) -> None:
+    assert daemon_module.request_daemon({"command": "ping"}, tmp_path / "missing.sock") is None
+
+
+def test_request_daemon_reports_a_silent_server(tmp_path: Path) -> None:
+    socket_path = tmp_path / "hung.sock"
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as server:
+        server.bind(str(socket_path))
+        server.listen()
+        payload = {"command": "ping"}
+        with pytest.raises(daemon_module.DaemonError, match="did not respond"):
+            daemon_module.request_daemon(payload, socket_path, timeout=0.1)
+
+
+def test_daemon_generates_html_and_reports_errors(tmp_path: Path) -> None:
+    socket_path = tmp_path / "daemon.sock"
+    output_file = tmp_path / "resume.html"
+
+    async def scenario() -> None:
+        server = daemon_module.RenderDaemon(socket_path)
+        await server.start()
+        try:
+            payload = {
+                "command": "generate",
+                "input_file": str(PROJECT_ROOT / "tests" / "data" / "resume.yaml"),
+                "output_file": str(output_file),
+            }
+            response = await asyncio.to_thread(daemon_module.request_daemon, payload, socket_path)
+            assert response == {"ok": True}
+
+            with pytest.raises(daemon_module.DaemonError, match="Unknown daemon command"):
+                await asyncio.to_thread(
+                    daemon_module.request_daemon, {"command": "nope"}, socket_path
+                )
+        finally:
+            await server.close()
+
+    asyncio.run(scenario())
+
+    assert "Sample Person" in output_file.read_text(encoding="utf-8")
+    assert not socket_path.exists()
@@ -1,8 +1,23 @@
 """Tests for HTML generator helpers."""
 from __future__ import annotations
 
-from resume_generator.generator import DEFAULT_CV_FOOTER, ResumeGenerator
-from resume_generator.models import Basics, Resume
+import asyncio
+import base64
+import io
+import shutil
+from datetime import date
+from pathlib import Path
+
+import pytest
+
+from resume_generator import generator as generator_module
+from resume_generator.assets import AssetCache, IconSprite, optimize_photo
+from resume_generator.fonts import FONT_FACES
+from resume_generator.generator import DEFAULT_CV_FOOTER, ResumeGenerator, compile_templates
+from resume_generator.models import Basics, Education, Location, Resume, Work
+from resume_generator.pdf import READY_MARKER, PdfRenderer
+
+TEMPLATE_DIR = Path(__file__).resolve().parents[1] / "resume_generator" / "templates"
 
 
 def test_generate_html_uses_default_footer_text() -> None:
@@ -20,3 +35,312 @@ def test_generate_html_renders_custom_footer_text() -> None:
     html = ResumeGenerator().generate_html(resume)
 
     assert custom_footer in html
+
+
+def _write_stub_font(path: Path) -> None:
+    from fontTools.fontBuilder import FontBuilder
+    from fontTools.pens.ttGlyphPen import TTGlyphPen
+
+    characters = "ABSabelmnoprs"
+    glyph_order = [".notdef", *characters]
+    builder = FontBuilder(1000, isTTF=True)
+    builder.setupGlyphOrder(glyph_order)
+    builder.setupCharacterMap({ord(char): char for char in characters})
+    builder.setupGlyf({name: TTGlyphPen(None).glyph() for name in glyph_order})
+    builder.setupHorizontalMetrics({name: (500, 0) for name in glyph_order})
+    builder.setupHorizontalHeader(ascent=800, descent=-200)
+    builder.setupNameTable({"familyName": "Stub", "styleName": "Regular"})
+    builder.setupOS2()
+    builder.setupPost()
+    builder.save(str(path))
+
+
+def test_generate_html_embeds_local_fonts(tmp_path: Path) -> None:
+    pytest.importorskip("fontTools")
+    pytest.importorskip("brotli")
+    for face in FONT_FACES:
+        _write_stub_font(tmp_path / face.filename)
+    resume = Resume(basics=Basics(name="Sample Person"))
+
+    html = ResumeGenerator(embed_fonts=True, font_dir=tmp_path).generate_html(resume)
+
+    assert "fonts.googleapis.com" not in html
+    assert html.count("src:url(data:font/woff2;base64,") == len(FONT_FACES)
+
+
+def test_embedded_fonts_cover_the_rendered_markdown(monkeypatch: pytest.MonkeyPatch) -> None:
+    subset_texts: list[str] = []
+
+    def fake_font_css(text: str, font_dir: Path | None = None) -> str:
+        subset_texts.append(text)
+        return "/* fonts */"
+
+    monkeypatch.setattr(generator_module, "build_font_css", fake_font_css)
+    summary = "Shipped (c) 2024 -- and more..."
+    resume = Resume(basics=Basics(name="Sample Person", summary=summary))
+
+    html = ResumeGenerator(embed_fonts=True).generate_html(resume)
+
+    assert "/* fonts */" in html
+    assert {"\u00a9", "\u2013", "\u2026"} <= set(subset_texts[0])
+
+
+def test_generate_html_signals_render_readiness() -> None:
+    html = ResumeGenerator().generate_html(Resume(basics=Basics(name="Sample Person")))
+
+    assert f"dataset.{READY_MARKER} = \"true\"" in html
+
+
+def test_generate_html_reuses_assets_until_files_change(tmp_path: Path) -> None:
+    photo = tmp_path / "profile.png"
+    photo.write_bytes(b"first")
+    generator = ResumeGenerator(profile_photo=photo)
+    resume = Resume(basics=Basics(name="Sample Person"))
+
+    first = generator.generate_html(resume)
+    misses = generator.asset_stats.misses
+    second = generator.generate_html(resume)
+
+    assert first == second
+    assert generator.asset_stats.misses == misses
+    assert generator.asset_stats.hits >= 2
+
+    photo.write_bytes(b"second photo")
+    third = generator.generate_html(resume)
+
+    assert generator.asset_stats.misses == misses + 1
+    assert base64.b64encode(b"second photo").decode("ascii") in third
+
+
+def test_asset_cache_evicts_least_recently_used_entries(tmp_path: Path) -> None:
+    cache = AssetCache(maxsize=2)
+
+    cache.get("a", (), lambda: "A")
+    cache.get("b", (), lambda: "B")
+    cache.get("a", (), lambda: "unused")
+    cache.get("c", (), lambda: "C")
+
+    assert len(cache) == 2
+    assert cache.get("a", (), lambda: "rebuilt") == "A"
+    assert cache.get("b", (), lambda: "rebuilt") == "rebuilt"
+
+
+def test_fallback_photo_follows_the_current_directory(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    generator = ResumeGenerator()
+    resume = Resume(basics=Basics(name="Sample Person"))
+    (tmp_path / "public").mkdir()
+    (tmp_path / "public" / "profile.jpg").write_bytes(b"photo in cwd")
+
+    monkeypatch.chdir(tmp_path)
+    html = generator.generate_html(resume)
+
+    assert base64.b64encode(b"photo in cwd").decode("ascii") in html
+
+
+def test_relative_picture_resolves_against_working_dir(tmp_path: Path) -> None:
+    (tmp_path / "me.jpg").write_bytes(b"client photo")
+    generator = ResumeGenerator(working_dir=tmp_path)
+    resume = Resume(basics=Basics(name="Sample Person", picture="me.jpg"))
+
+    html = generator.generate_html(resume)
+
+    assert base64.b64encode(b"client photo").decode("ascii") in html
+
+
+def test_compiled_templates_render_like_sources(tmp_path: Path) -> None:
+    archive = compile_templates(None, tmp_path / "templates.zip")
+    resume = Resume(basics=Basics(name="Sample Person", summary="Uses **Markdown**."))
+
+    compiled = ResumeGenerator(compiled_templates=archive).generate_html(resume)
+
+    assert compiled == ResumeGenerator().generate_html(resume)
+
+
+def test_compiled_templates_must_match_their_sources(tmp_path: Path) -> None:
+    theme = tmp_path / "theme"
+    shutil.copytree(TEMPLATE_DIR, theme)
+    archive = compile_templates(theme, tmp_path / "templates.zip")
+
+    with pytest.raises(ValueError, match="were built from"):
+        ResumeGenerator(compiled_templates=archive)
+
+    ResumeGenerator(template_dir=theme, compiled_templates=archive)
+    with (theme / "resume.html").open("a", encoding="utf-8") as template:
+        template.write("<!-- edited -->")
+    with pytest.raises(ValueError, match="out of date"):
+        ResumeGenerator(template_dir=theme, compiled_templates=archive)
+
+
+def test_bytecode_cache_persists_compiled_templates(isolated_cache_dir: Path) -> None:
+    resume = Resume(basics=Basics(name="Sample Person"))
+
+    ResumeGenerator(bytecode_cache=True).generate_html(resume)
+
+    assert any((isolated_cache_dir / "jinja").iterdir())
+
+
+def test_icon_sprite_emits_each_used_symbol_once() -> None:
+    resume = Resume(
+        basics=Basics(name="Sample Person", summary="Hello", location=Location(city="Kyiv")),
+        work=[Work(name="Acme"), Work(name="Globex")],
+    )
+
+    html = ResumeGenerator(icon_sprite=True).generate_html(resume)
+
+    assert html.count('<symbol id="icon-experience"') == 1
+    assert html.count('<use href="#icon-experience">') == 1
+    assert '<symbol id="icon-summary"' in html
+    assert '<symbol id="icon-hobbies"' not in html
+    assert ResumeGenerator().generate_html(resume).count("<symbol") == 0
+
+
+def test_icon_sprite_shares_identical_artwork() -> None:
+    sprite = IconSprite()
+
+    assert sprite.symbol_ids["skills"] == sprite.symbol_ids["experience"]
+    assert sprite.symbol_ids["language"] == sprite.symbol_ids["summary"]
+    assert len(sprite.symbols) == len(sprite.references) - 2
+
+
+def test_photo_dpi_downscales_and_caches_photo(tmp_path: Path, isolated_cache_dir: Path) -> None:
+    image_module = pytest.importorskip("PIL.Image")
+    photo = tmp_path / "profile.jpg"
+    image_module.new("RGB", (1200, 900), "teal").save(photo, format="JPEG", quality=95)
+    resume = Resume(basics=Basics(name="Sample Person"))
+
+    html = ResumeGenerator(profile_photo=photo, photo_dpi=192).generate_html(resume)
+
+    encoded = html.split("data:image/webp;base64,", 1)[1].split('"', 1)[0]
+    with image_module.open(io.BytesIO(base64.b64decode(encoded))) as optimized:
+        assert optimized.size == (170, 170)
+    assert len(encoded) < len(base64.b64encode(photo.read_bytes()))
+    assert len(list((isolated_cache_dir / "images").iterdir())) == 1
+
+
+def test_photo_dpi_embeds_undecodable_photos_untouched(
+    tmp_path: Path, isolated_cache_dir: Path
+) -> None:
+    pytest.importorskip("PIL.Image")
+    photo = tmp_path / "profile.jpg"
+    photo.write_bytes(b"not really a jpeg")
+    resume = Resume(basics=Basics(name="Sample Person"))
+
+    html = ResumeGenerator(profile_photo=photo, photo_dpi=192).generate_html(resume)
+
+    assert f"data:image/jpeg;base64,{base64.b64encode(b'not really a jpeg').decode()}" in html
+    assert not list((isolated_cache_dir / "images").glob("*.webp"))
+
+
+def test_optimize_photo_keeps_palette_transparency(tmp_path: Path) -> None:
+    image_module = pytest.importorskip("PIL.Image")
+    photo = tmp_path / "profile.png"
+    palette = image_module.new("P", (400, 400), 0)
+    palette.putpalette([0, 0, 0, 0, 128, 128])
+    palette.paste(1, (100, 100, 300, 300))
+    palette.save(photo, transparency=0)
+
+    uri = optimize_photo(photo, dpi=96, cache_dir=tmp_path / "cache")
+
+    assert uri is not None
+    encoded = uri.removeprefix("data:image/webp;base64,")
+    with image_module.open(io.BytesIO(base64.b64decode(encoded))) as optimized:
+        assert optimized.mode == "RGBA"
+        assert optimized.getpixel((0, 0))[3] == 0
+        assert optimized.getpixel((42, 42))[3] == 255
+
+
+def test_stream_html_matches_generate_html(tmp_path: Path) -> None:
+    resume = Resume(basics=Basics(name="Sample Person", summary="Uses **Markdown**."))
+    generator = ResumeGenerator(icon_sprite=True)
+    buffer = io.StringIO()
+
+    generator.stream_html(resume, buffer)
+    generator.generate_html_file(resume, tmp_path / "resume.html")
+
+    expected = generator.generate_html(resume)
+    assert buffer.getvalue() == expected
+    assert (tmp_path / "resume.html").read_text(encoding="utf-8") == expected
+
+
+def test_async_markdown_tag_matches_the_sync_tag(tmp_path: Path) -> None:
+    (tmp_path / "resume.html").write_text(
+        "{% markdown %}\n  Uses *Markdown*.\n{% endmarkdown %}", encoding="utf-8"
+    )
+    generator = ResumeGenerator(template_dir=tmp_path)
+    resume = Resume(basics=Basics(name="Sample Person"))
+
+    rendered = asyncio.run(generator.generate_html_async(resume))
+
+    assert rendered == generator.generate_html(resume)
+    assert rendered == "<p>Uses <em>Markdown</em>.</p>"
+
+
+def test_render_resume_renders_html_async_and_pdf(fake_playwright) -> None:
+    recorder = fake_playwright()
+    resume = Resume(basics=Basics(name="Sample Person", summary="Uses **Markdown**."))
+    generator = ResumeGenerator()
+
+    async def render() -> tuple[str, bytes]:
+        async with PdfRenderer() as renderer:
+            return await generator.render_resume(resume, renderer=renderer, use_cache=False)
+
+    html, pdf = asyncio.run(render())
+
+    assert html == generator.generate_html(resume)
+    assert "<strong>Markdown</strong>" in html
+    assert recorder["set_content"][0] == html
+    assert pdf == b"stub-pdf"
+
+
+def test_date_ranges_parse_dates_with_durations() -> None:
+    closed = Work(name="Acme", startDate="2019-01", endDate="2021-07-01")
+    open_ended = Education(institution="Uni", startDate="2020")
+
+    assert closed.start == date(2019, 1, 1)
+    assert closed.duration() == "2.5"
+    assert open_ended.end is None
+    assert open_ended.duration(date(2023, 1, 1)) == "3.0"
+    assert Work(startDate="someday").duration() is None
+
+
+def test_date_ranges_follow_field_updates() -> None:
+    job = Work(name="Acme", startDate="2019-01", endDate="2021-07-01")
+    assert job.duration() == "2.5"
+
+    job.endDate = "2020-01"
+    moved = job.model_copy(update={"startDate": "2015-01"})
+
+    assert job.end == date(2020, 1, 1)
+    assert job.duration() == "1.0"
+    assert moved.start == date(2015, 1, 1)
+    assert moved.duration() == "5.0"
+
+
+def test_open_ended_durations_use_pinned_today() -> None:
+    resume = Resume(
+        basics=Basics(name="Sample Person"),
+        work=[Work(name="Acme", startDate="2020-01-01")],
+    )
+
+    html = ResumeGenerator(today=date(2024, 1, 1)).generate_html(resume)
+
+    assert "(4.0 years)" in html
+
+
+def test_failed_html_render_leaves_no_partial_file(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    generator = ResumeGenerator()
+    output_path = tmp_path / "resume.html"
+
+    def failing_stream(resume: Resume, stream: io.TextIOBase) -> None:
+        stream.write("<html><body>")
+        raise RuntimeError("template failed")
+
+    monkeypatch.setattr(generator, "stream_html", failing_stream)
+
+    with pytest.raises(RuntimeError, match="template failed"):
+        generator.generate_html_file(Resume(basics=Basics(name="Sample Person")), output_path)
+    assert list(tmp_path.iterdir()) == []
@@ -1,11 +1,21 @@
 """Tests for loading resume data from JSON and YAML files."""
 from __future__ import annotations
 
+import json
 from pathlib import Path
 
 import pytest
 
-from resume_generator.loader import load_resume_data, load_resume_model
+from resume_generator import loader
+from resume_generator.loader import (
+    ModelCache,
+    construct_resume,
+    iter_resume_records,
+    load_resume_data,
+    load_resume_model,
+    parser_backends,
+    validate_resumes,
+)
 from resume_generator.models import Resume
 
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
@@ -42,4 +52,152 @@ def test_load_resume_model_returns_resume_instance(sample_path: Path) -> None:
         if sample_path.suffix == ".yaml"
         else "Custom consent text from JSON."
     )
-    assert resume.cvFooter == expected_footer
\ No newline at end of file
+    assert resume.cvFooter == expected_footer
+
+
+@pytest.mark.parametrize("sample_path", SAMPLE_FILES)
+def test_load_resume_data_sniffs_unknown_extensions(
+    sample_path: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    target = tmp_path / "resume.txt"
+    target.write_text(sample_path.read_text(encoding="utf-8"), encoding="utf-8")
+    calls: list[str] = []
+    load_json, load_yaml = loader._load_json, loader._load_yaml
+    monkeypatch.setattr(loader, "_load_json", lambda text: calls.append("json") or load_json(text))
+    monkeypatch.setattr(loader, "_load_yaml", lambda text: calls.append("yaml") or load_yaml(text))
+
+    data = load_resume_data(target)
+
+    assert data["basics"]["name"] == "Sample Person"
+    assert calls == [sample_path.suffix.lstrip(".")]
+
+
+def test_parser_backends_reports_each_format() -> None:
+    backends = parser_backends()
+
+    assert backends["json"] in {"orjson", "json"}
+    assert backends["yaml"] in {"libyaml", "pyyaml"}
+
+
+def test_model_cache_skips_parsing_unchanged_files(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    target = tmp_path / "resume.yaml"
+    target.write_text(SAMPLE_FILES[1].read_text(encoding="utf-8"), encoding="utf-8")
+    cache = ModelCache(tmp_path / "models")
+
+    first = load_resume_model(target, cache)
+    monkeypatch.setattr(loader, "_validate_content", lambda *_args: pytest.fail("parsed again"))
+    second = load_resume_model(target, cache)
+
+    assert second == first
+    assert first.work and second.work and second.work[0].start == first.work[0].start
+    assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+
+    monkeypatch.undo()
+    target.write_text(target.read_text(encoding="utf-8") + "\n# edited\n", encoding="utf-8")
+    load_resume_model(target, cache)
+
+    assert cache.stats.misses == 2
+
+
+def test_model_cache_is_scoped_to_the_schema_version(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    load_resume_model(SAMPLE_FILES[0], ModelCache(tmp_path))
+    monkeypatch.setattr(loader, "_schema_version", lambda: "changed-models")
+    cache = ModelCache(tmp_path)
+
+    load_resume_model(SAMPLE_FILES[0], cache)
+
+    assert (cache.stats.hits, cache.stats.misses) == (0, 1)
+
+
+def test_load_resume_model_validates_json_bytes_directly(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(loader, "_load_json", lambda _text: pytest.fail("dict detour"))
+    flow_yaml = tmp_path / "resume.txt"
+    flow_yaml.write_text("{basics: {name: Flow Person}}", encoding="utf-8")
+
+    assert load_resume_model(SAMPLE_FILES[0]).basics.name == "Sample Person"
+    assert load_resume_model(flow_yaml).basics.name == "Flow Person"
+
+
+def test_validate_resumes_accepts_json_arrays_and_lists() -> None:
+    payload = b'[{"basics": {"name": "Ada"}}, {"basics": {"name": "Grace"}}]'
+
+    from_json = validate_resumes(payload)
+    from_python = validate_resumes([{"basics": {"name": "Ada"}}])
+
+    assert [resume.basics.name for resume in from_json] == ["Ada", "Grace"]
+    assert from_python[0] == from_json[0]
+
+
+@pytest.mark.parametrize("sample_path", SAMPLE_FILES)
+def test_trusted_load_matches_validated_model(sample_path: Path) -> None:
+    trusted = load_resume_model(sample_path, trusted=True)
+
+    assert trusted == load_resume_model(sample_path)
+    assert validate_resumes([load_resume_data(sample_path)], trusted=True) == [trusted]
+
+
+def test_trusted_load_reads_but_never_fills_the_model_cache(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    cache = ModelCache(tmp_path / "models")
+
+    load_resume_model(SAMPLE_FILES[0], cache, trusted=True)
+    assert not cache.directory.exists()
+
+    validated = load_resume_model(SAMPLE_FILES[0], cache)
+    monkeypatch.setattr(loader, "construct_resume", lambda _data: pytest.fail("built again"))
+
+    assert load_resume_model(SAMPLE_FILES[0], cache, trusted=True) == validated
+    assert (cache.stats.hits, cache.stats.misses) == (1, 2)
+
+
+def test_construct_resume_checks_structure() -> None:
+    with pytest.raises(ValueError, match=r"resume\.basics: missing required field 'name'"):
+        construct_resume({"basics": {}})
+    with pytest.raises(ValueError, match=r"resume\.work\[0\]: expected a mapping"):
+        construct_resume({"basics": {"name": "Ada"}, "work": ["Acme"]})
+
+
+def test_iter_resume_records_streams_json_lines_and_yaml_documents(tmp_path: Path) -> None:
+    record = json.loads(SAMPLE_FILES[0].read_text(encoding="utf-8"))
+    lines = tmp_path / "export.jsonl"
+    lines.write_text(
+        json.dumps(record) + "\n\n" + json.dumps({"basics": {"name": "Second"}}) + "\n",
+        encoding="utf-8",
+    )
+    documents = tmp_path / "export.yaml"
+    documents.write_text(
+        SAMPLE_FILES[1].read_text(encoding="utf-8") + "\n---\nbasics:\n  name: Second\n",
+        encoding="utf-8",
+    )
+
+    for path in (lines, documents):
+        records = iter_resume_records(path)
+        assert next(records).basics.name == "Sample Person"
+        assert [resume.basics.name for resume in records] == ["Second"]
+
+
+def test_iter_resume_records_names_the_failing_record(tmp_path: Path) -> None:
+    lines = tmp_path / "export.jsonl"
+    lines.write_text('{"basics": {"name": "Ada"}}\n{"basics": {}}\n', encoding="utf-8")
+
+    with pytest.raises(ValueError) as excinfo:
+        list(iter_resume_records(lines))
+
+    assert f"while loading record 2 of {lines}" in excinfo.value.__notes__
+
+
+def test_iter_resume_records_caches_each_json_line(tmp_path: Path) -> None:
+    lines = tmp_path / "export.jsonl"
+    lines.write_text('{"basics": {"name": "Ada"}}\n{"basics": {"name": "Ada"}}\n', encoding="utf-8")
+    cache = ModelCache(tmp_path / "models")
+
+    list(iter_resume_records(lines, cache))
+
+    assert (cache.stats.hits, cache.stats.misses) == (1, 1)
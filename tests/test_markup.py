@@ -0,0 +1,40 @@
+"""Tests for the memoized Markdown filter."""
+from __future__ import annotations
+
+from resume_generator.generator import ResumeGenerator
+from resume_generator.markup import MarkdownCache
+from resume_generator.models import Basics, PortfolioItem, Resume
+
+
+def test_markdown_cache_evicts_least_recently_used_entry() -> None:
+    cache = MarkdownCache(maxsize=2)
+
+    first = cache.convert("**one**")
+    cache.convert("**two**")
+    assert cache.convert("**one**") == first
+    cache.convert("**three**")
+    cache.convert("**two**")
+
+    assert len(cache) == 2
+    assert (cache.stats.hits, cache.stats.misses) == (1, 4)
+
+
+def test_markdown_filter_escapes_raw_html() -> None:
+    html = MarkdownCache().filter("Uses <b>tags</b> & *emphasis*")
+
+    assert html == "<p>Uses &lt;b&gt;tags&lt;/b&gt; &amp; <em>emphasis</em></p>"
+
+
+def test_repeated_descriptions_hit_the_markdown_cache() -> None:
+    description = "A shared *boilerplate* description."
+    resume = Resume(
+        basics=Basics(name="Sample Person"),
+        portfolio=[PortfolioItem(name=name, description=description) for name in "ABC"],
+    )
+    generator = ResumeGenerator()
+    hits = generator.markdown_stats.hits
+
+    html = generator.generate_html(resume)
+
+    assert html.count("<em>boilerplate</em>") == 3
+    assert generator.markdown_stats.hits >= hits + 2
@@ -3,130 +3,243 @@ from __future__ import annotations
 
 import asyncio
 import html
+import os
+import time
 from pathlib import Path
 from typing import Any, Dict
 
+import pytest
+
 from resume_generator import pdf as pdf_module
 
 
-class FakePage:
-    def __init__(self, recorder: Dict[str, Any]) -> None:
-        self.recorder = recorder
+def test_html_to_pdf_uses_base_url_when_provided(fake_playwright, tmp_path):
+    recorder = fake_playwright()
 
-    async def goto(self, url: str, wait_until: str) -> None:  # pragma: no cover - simple recorder
-        self.recorder["goto"] = (url, wait_until)
+    output_pdf = tmp_path / "resume.pdf"
+    asyncio.run(pdf_module.html_to_pdf("<p>hello</p>", output_pdf, base_url="file:///resume.html"))
 
-    async def set_content(self, content: str, wait_until: str) -> None:
-        self.recorder["set_content"] = (content, wait_until)
+    assert recorder["goto"] == ("file:///resume.html", "networkidle")
+    assert "set_content" not in recorder
+    assert output_pdf.exists()
 
-    async def wait_for_load_state(self, state: str) -> None:
-        self.recorder["load_state"] = state
 
-    async def evaluate(self, script: str) -> None:
-        self.recorder["evaluate_script"] = script
+def test_html_to_pdf_sets_content_without_base_url(fake_playwright, tmp_path):
+    recorder = fake_playwright()
 
-    async def pdf(self, path: str, format: str, print_background: bool) -> None:
-        self.recorder["pdf_call"] = {
-            "path": Path(path),
-            "format": format,
-            "print_background": print_background,
-        }
-        Path(path).write_text("stub-pdf", encoding="utf-8")
+    output_pdf = tmp_path / "resume.pdf"
+    asyncio.run(pdf_module.html_to_pdf("<p>hello</p>", output_pdf))
 
+    assert recorder["set_content"][0] == "<p>hello</p>"
+    assert output_pdf.exists()
 
-class FakeContext:
-    def __init__(self, recorder: Dict[str, Any]) -> None:
-        self.recorder = recorder
 
-    async def new_page(self) -> FakePage:
-        return FakePage(self.recorder)
+def test_render_pdf_from_html_file_runs_async_conversion(monkeypatch, tmp_path):
+    html_path = tmp_path / "resume.html"
+    html_text = "<h1>Hi &amp; Bye</h1>"
+    html_path.write_text(html_text, encoding="utf-8")
 
-    async def close(self) -> None:
-        self.recorder["context_closed"] = True
+    recorded: Dict[str, Any] = {}
 
+    async def fake_html_to_pdf(html_content, output_path, base_url=None, **_options):
+        recorded["html_content"] = html_content
+        recorded["output_path"] = Path(output_path)
+        recorded["base_url"] = base_url
+        Path(output_path).write_text("stub-pdf", encoding="utf-8")
 
-class FakeBrowser:
-    def __init__(self, recorder: Dict[str, Any]) -> None:
-        self.recorder = recorder
+    monkeypatch.setattr(pdf_module, "html_to_pdf", fake_html_to_pdf)
 
-    async def new_context(self, bypass_csp: bool) -> FakeContext:
-        self.recorder["bypass_csp"] = bypass_csp
-        return FakeContext(self.recorder)
+    pdf_path = pdf_module.render_pdf_from_html_file(html_path)
 
-    async def close(self) -> None:
-        self.recorder["browser_closed"] = True
+    assert pdf_path == html_path.with_suffix(".pdf")
+    assert pdf_path.exists()
+    assert recorded["html_content"] == html.unescape(html_text)
+    assert recorded["base_url"] == html_path.resolve().as_uri()
 
 
-class FakeChromium:
-    def __init__(self, recorder: Dict[str, Any]) -> None:
-        self.recorder = recorder
+def test_pdf_renderer_reuses_browser_and_page(fake_playwright, tmp_path):
+    recorder = fake_playwright()
 
-    async def launch(self, args):
-        self.recorder["launch_args"] = args
-        return FakeBrowser(self.recorder)
+    async def render_all() -> None:
+        async with pdf_module.PdfRenderer() as renderer:
+            for index in range(3):
+                await renderer.render("<p>hello</p>", tmp_path / f"resume-{index}.pdf")
 
+    asyncio.run(render_all())
 
-class FakePlaywright:
-    def __init__(self, recorder: Dict[str, Any]) -> None:
-        self.recorder = recorder
-        self.chromium = FakeChromium(recorder)
+    assert recorder["launches"] == 1
+    assert recorder["contexts"] == 1
+    assert recorder["browser_closed"] and recorder["playwright_closed"]
+    assert sorted(p.name for p in tmp_path.glob("*.pdf")) == [
+        "resume-0.pdf",
+        "resume-1.pdf",
+        "resume-2.pdf",
+    ]
 
-    async def __aenter__(self) -> "FakePlaywright":
-        return self
 
-    async def __aexit__(self, exc_type, exc, tb) -> None:
-        self.recorder["playwright_closed"] = True
+def test_render_pdfs_from_html_files_bounds_concurrency(fake_playwright, tmp_path):
+    recorder = fake_playwright(pdf_delay=0.01)
 
+    jobs = []
+    for index in range(6):
+        html_path = tmp_path / f"resume-{index}.html"
+        html_path.write_text("<p>hello</p>", encoding="utf-8")
+        jobs.append((html_path, html_path.with_suffix(".pdf")))
 
-def test_html_to_pdf_uses_base_url_when_provided(monkeypatch, tmp_path):
-    recorder: Dict[str, Any] = {}
+    rendered = pdf_module.render_pdfs_from_html_files(jobs, concurrency=3)
 
-    def fake_async_playwright():
-        return FakePlaywright(recorder)
+    assert rendered == [pdf_path for _, pdf_path in jobs]
+    assert all(pdf_path.exists() for pdf_path in rendered)
+    assert recorder["peak"] == 3
 
-    monkeypatch.setattr(pdf_module, "async_playwright", fake_async_playwright)
 
-    output_pdf = tmp_path / "resume.pdf"
-    asyncio.run(pdf_module.html_to_pdf("<p>hello</p>", output_pdf, base_url="file:///resume.html"))
+def test_render_pdfs_from_html_prepares_sync_jobs_while_printing(fake_playwright, tmp_path):
+    recorder = fake_playwright(pdf_delay=0.2)
+    printing_while_preparing = []
 
-    assert recorder["goto"] == ("file:///resume.html", "networkidle")
-    assert "set_content" not in recorder
-    assert output_pdf.exists()
+    def jobs():
+        for index in range(3):
+            if index:
+                time.sleep(0.05)
+                printing_while_preparing.append(recorder["active"])
+            yield "<p>hello</p>", tmp_path / f"resume-{index}.pdf"
 
+    pdf_module.render_pdfs_from_html(jobs(), concurrency=3)
 
-def test_html_to_pdf_sets_content_without_base_url(monkeypatch, tmp_path):
-    recorder: Dict[str, Any] = {}
+    assert printing_while_preparing == [1, 2]
 
-    def fake_async_playwright():
-        return FakePlaywright(recorder)
 
-    monkeypatch.setattr(pdf_module, "async_playwright", fake_async_playwright)
+def test_render_pdf_from_html_returns_bytes_without_writing(
+    fake_playwright, monkeypatch, tmp_path
+):
+    recorder = fake_playwright()
+    monkeypatch.chdir(tmp_path)
 
-    output_pdf = tmp_path / "resume.pdf"
-    asyncio.run(pdf_module.html_to_pdf("<p>hello</p>", output_pdf))
+    pdf_bytes = pdf_module.render_pdf_from_html("<p>hello &amp; bye</p>")
 
-    assert recorder["set_content"][0] == "<p>hello</p>"
-    assert output_pdf.exists()
+    assert pdf_bytes == b"stub-pdf"
+    assert recorder["set_content"][0] == "<p>hello &amp; bye</p>"
+    assert recorder["pdf_call"]["path"] is None
+    assert not any(tmp_path.iterdir())
 
 
-def test_render_pdf_from_html_file_runs_async_conversion(monkeypatch, tmp_path):
-    html_path = tmp_path / "resume.html"
-    html_text = "<h1>Hi &amp; Bye</h1>"
-    html_path.write_text(html_text, encoding="utf-8")
+def test_renderer_waits_for_ready_marker_instead_of_network_idle(fake_playwright, tmp_path):
+    recorder = fake_playwright()
 
-    recorded: Dict[str, Any] = {}
+    document = '<p>hello</p><script>document.documentElement.dataset.renderReady = "true";</script>'
+    asyncio.run(pdf_module.html_to_pdf(document, tmp_path / "resume.pdf", ready_timeout_ms=250))
 
-    async def fake_html_to_pdf(html_content, output_path, base_url=None):
-        recorded["html_content"] = html_content
-        recorded["output_path"] = Path(output_path)
-        recorded["base_url"] = base_url
-        Path(output_path).write_text("stub-pdf", encoding="utf-8")
+    assert recorder["set_content"] == (document, "load")
+    assert recorder["wait_for_function"][1] == 250
+    assert "evaluate_script" not in recorder
 
-    monkeypatch.setattr(pdf_module, "html_to_pdf", fake_html_to_pdf)
 
-    pdf_path = pdf_module.render_pdf_from_html_file(html_path)
+def test_renderer_reports_ready_timeout(fake_playwright, tmp_path):
+    recorder = fake_playwright(ready=False)
 
-    assert pdf_path == html_path.with_suffix(".pdf")
-    assert pdf_path.exists()
-    assert recorded["html_content"] == html.unescape(html_text)
-    assert recorded["base_url"] == html_path.resolve().as_uri()
\ No newline at end of file
+    with pytest.raises(pdf_module.RenderTimeoutError):
+        asyncio.run(
+            pdf_module.html_to_pdf(
+                "<script>document.documentElement.dataset.renderReady = 'true'</script>",
+                tmp_path / "resume.pdf",
+            )
+        )
+    assert "pdf_call" not in recorder
+
+
+def test_text_mentioning_the_marker_does_not_opt_into_the_ready_protocol(
+    fake_playwright, tmp_path
+):
+    recorder = fake_playwright(ready=False)
+
+    document = "<p>Wired renderReady into the dataset.renderReady = &#34;true&#34; flow</p>"
+    asyncio.run(pdf_module.html_to_pdf(document, tmp_path / "resume.pdf"))
+
+    assert recorder["set_content"] == (document, "networkidle")
+    assert "wait_for_function" not in recorder
+
+
+def test_cached_render_skips_browser_launch(fake_playwright, tmp_path):
+    recorder = fake_playwright()
+    cache = pdf_module.PdfCache(tmp_path / "cache")
+
+    async def render(target: Path) -> bytes:
+        async with pdf_module.PdfRenderer(cache=cache) as renderer:
+            return await renderer.render("<p>hello</p>", target)
+
+    first = asyncio.run(render(tmp_path / "first.pdf"))
+    second = asyncio.run(render(tmp_path / "second.pdf"))
+
+    assert first == second == b"stub-pdf"
+    assert recorder["launches"] == 1
+    assert (tmp_path / "second.pdf").read_bytes() == b"stub-pdf"
+
+
+def test_pdf_cache_evicts_least_recently_used(tmp_path):
+    cache = pdf_module.PdfCache(tmp_path, max_bytes=10)
+    keys = [cache.key(f"<p>{index}</p>") for index in range(3)]
+
+    cache.put(keys[0], b"aaaa")
+    cache.put(keys[1], b"bbbb")
+    for offset, key in enumerate(keys[:2]):
+        entry = tmp_path / key[:2] / f"{key}.pdf"
+        os.utime(entry, (1_000 + offset, 1_000 + offset))
+    assert cache.get(keys[0]) == b"aaaa"  # refreshes the first entry
+    cache.put(keys[2], b"cccc")
+
+    assert cache.get(keys[0]) == b"aaaa"
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[2]) == b"cccc"
+
+
+def test_pdf_cache_tolerates_entries_removed_by_other_workers(tmp_path, monkeypatch):
+    cache = pdf_module.PdfCache(tmp_path, max_bytes=6)
+    # A link to nothing lists like an entry but fails to stat, as if just evicted.
+    (tmp_path / "00").mkdir()
+    (tmp_path / "00" / "vanished.pdf").symlink_to(tmp_path / "missing.pdf")
+    keys = [cache.key(f"<p>{index}</p>") for index in range(2)]
+
+    cache.put(keys[0], b"aaaa")
+    cache.put(keys[1], b"bbbb")
+
+    def evicted_meanwhile(path, *args):
+        Path(path).unlink()
+        raise FileNotFoundError(path)
+
+    monkeypatch.setattr(pdf_module.os, "utime", evicted_meanwhile)
+    assert cache.get(keys[1]) == b"bbbb"
+    assert cache.get(keys[1]) is None
+
+
+def test_rewriting_a_cache_hit_output_leaves_the_cache_entry_intact(fake_playwright, tmp_path):
+    recorder = fake_playwright()
+    cache = pdf_module.PdfCache(tmp_path / "cache")
+    output = tmp_path / "resume.pdf"
+
+    async def render(document: str, use_cache: bool = True) -> bytes:
+        async with pdf_module.PdfRenderer(cache=cache) as renderer:
+            return await renderer.render(document, output, use_cache=use_cache)
+
+    asyncio.run(render("<p>A</p>"))
+    asyncio.run(render("<p>A</p>"))
+    recorder["pdf_bytes"] = b"pdf-B"
+    asyncio.run(render("<p>B</p>", use_cache=False))
+
+    assert output.read_bytes() == b"pdf-B"
+    assert cache.get(cache.key("<p>A</p>")) == b"stub-pdf"
+
+
+def test_documents_loaded_from_base_url_bypass_the_cache(fake_playwright, tmp_path):
+    recorder = fake_playwright()
+    cache = pdf_module.PdfCache(tmp_path / "cache")
+
+    async def render() -> None:
+        async with pdf_module.PdfRenderer(cache=cache) as renderer:
+            await renderer.render("<p>hello</p>", tmp_path / "a.pdf", base_url="file:///a.html")
+            await renderer.render("<p>hello</p>", tmp_path / "b.pdf", base_url="file:///a.html")
+
+    asyncio.run(render())
+
+    assert recorder["launches"] == 1
+    assert not list((tmp_path / "cache").glob("*/*.pdf"))
+    assert (tmp_path / "b.pdf").read_bytes() == b"stub-pdf"
@@ -0,0 +1,79 @@
+"""Tests for the bounded-queue stage pipeline."""
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from resume_generator.pipeline import Pipeline
+
+
+def test_pipeline_maps_items_in_order_through_every_stage() -> None:
+    pipeline = (
+        Pipeline(range(5), name="numbers", maxsize=2)
+        .stage("double", lambda item: [item * 2])
+        .stage("split", lambda item: [item, -item] if item else [])
+    )
+
+    assert list(pipeline) == [2, -2, 4, -4, 6, -6, 8, -8]
+    assert [(stats.name, stats.processed) for stats in pipeline.stats] == [
+        ("numbers", 5),
+        ("double", 5),
+        ("split", 8),
+    ]
+    assert all(stats.peak_depth <= 2 for stats in pipeline.stats)
+
+
+def test_pipeline_queues_bound_how_far_producers_run_ahead() -> None:
+    produced: list[int] = []
+    release = threading.Event()
+
+    def source():
+        for item in range(10):
+            produced.append(item)
+            yield item
+
+    def slow(item: int) -> list[int]:
+        release.wait()
+        return [item]
+
+    pipeline = Pipeline(source(), maxsize=2).stage("slow", slow)
+    items = iter(pipeline)
+    consumer = threading.Thread(target=lambda: next(items))
+    consumer.start()
+    while len(produced) < 4:
+        time.sleep(0.01)
+    time.sleep(0.05)
+    # Two items queued, one taken by the blocked stage, one waiting to be put.
+    assert len(produced) == 4
+    assert pipeline.depths()["source"] == 2
+    release.set()
+    consumer.join()
+    assert list(items) == list(range(1, 10))
+
+
+def test_pipeline_reraises_the_first_stage_error() -> None:
+    def explode(item: int) -> list[int]:
+        if item == 3:
+            raise ValueError("bad record 3")
+        return [item]
+
+    pipeline = Pipeline(range(100), maxsize=1).stage("check", explode)
+
+    with pytest.raises(ValueError, match="bad record 3"):
+        list(pipeline)
+
+
+def test_pipeline_supports_async_iteration() -> None:
+    async def collect() -> list[str]:
+        pipeline = Pipeline("abc").stage("upper", lambda item: [item.upper()])
+        return [item async for item in pipeline]
+
+    assert asyncio.run(collect()) == ["A", "B", "C"]
+
+
+def test_pipeline_rejects_empty_queues() -> None:
+    with pytest.raises(ValueError, match="queue size"):
+        Pipeline([], maxsize=0)